@@ -5,8 +5,12 @@
 # ------------------------------------------------------------------------------
 from __future__ import annotations
 
+import copy
 import fnmatch
+import functools
 import importlib
+import inspect
+import itertools
 import operator
 import os
 import re
@@ -15,6 +19,7 @@ from datetime import (
     datetime,
     timedelta,
 )
+from pathlib import Path
 from typing import (
     Optional,
     Union,
@@ -37,6 +42,11 @@ from .utils.reusables import (
     must_list,
 )
 
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as YamlLoader
+
 PARAMS = Params(param_name="parameters.yaml")
 registers = Params(param_name="registers.yaml")
 logger = logging.getLogger(__name__)
@@ -50,16 +60,23 @@ def sort_by_priority(
     priority_dict: dict = {
         k: i for i, k in enumerate(priority_lists or PARAMS.list_tbl_priority)
     }
+    # NOTE: Group the prefixes by its first letter with the same checking
+    #   order, so the value will check only the prefixes that able to match it.
+    #   The empty prefix matches all values, so the prefixes after it will
+    #   never check.
+    priority_groups: dict[str, list[tuple[str, int]]] = {}
+    default: int = len(values)
+    for prefix, order in priority_dict.items():
+        if prefix == "":
+            default = order
+            break
+        priority_groups.setdefault(prefix[0], []).append((prefix, order))
 
     def priority_getter(value):
-        return next(
-            (
-                order
-                for _, order in priority_dict.items()
-                if value.startswith(_)
-            ),
-            len(values),
-        )
+        for prefix, order in priority_groups.get(value[:1], ()):
+            if value.startswith(prefix):
+                return order
+        return default
 
     if isinstance(values, list):
         return sorted(values, key=priority_getter)
@@ -105,10 +122,32 @@ def get_plural(
     return (word_change or "s") if num > 1 else (word_start or "")
 
 
-def get_process_id(process: str, fmt: str = "%Y%m%d%H%M%S%f") -> str:
-    """Get process ID from input string that combine timestamp and hashing of
-    argument process together."""
-    return get_run_date(fmt=fmt)[:-2] + hash_string(process)
+def get_process_id(process: str, fmt: str = "%Y%m%d%H%M%S") -> str:
+    """Get process ID from input string that combine timestamp with the first
+    4 digits of microsecond and hashing of argument process together."""
+    run_date: datetime = get_run_date(date_type="datetime")
+    return (
+        f"{run_date:{fmt}}{run_date.microsecond // 100:04d}"
+        f"{hash_string(process)}"
+    )
+
+
+# NOTE: Mapping of run type and its pair of process date converters that use
+#   with (default, invert) mode. The other run types will use run date.
+PROCESS_DATE_CONVERTERS: dict[str, tuple[callable, callable]] = {
+    "weekly": (
+        lambda dt: dt - timedelta(dt.isoweekday()),
+        lambda dt: dt - timedelta(dt.weekday()),
+    ),
+    "monthly": (
+        lambda dt: dt.replace(day=1),
+        lambda dt: dt.replace(day=1) + relativedelta(months=1, days=-1),
+    ),
+    "yearly": (
+        lambda dt: dt.replace(month=1, day=1),
+        lambda dt: dt.replace(month=1, day=1) + relativedelta(years=1, days=-1),
+    ),
+}
 
 
 def get_process_date(
@@ -130,37 +169,13 @@ def get_process_date(
         >>> get_process_date('2022-01-20', 'weekly')
         '2022-01-17'
     """
-    run_type: str = (
-        run_type if run_type in PARAMS.map_tbl_ps_date.keys() else "daily"
-    )
     run_date_ts: date = (
         date.fromisoformat(run_date) if isinstance(run_date, str) else run_date
     )
-
-    if run_type == "weekly":
-        run_date_convert_ts = (
-            run_date_ts - timedelta(run_date_ts.weekday())
-            if invert
-            else run_date_ts - timedelta(run_date_ts.isoweekday())
-        )
-    elif run_type == "monthly":
-        run_date_convert_ts = (
-            run_date_ts.replace(day=1)
-            + relativedelta(months=1)
-            - relativedelta(days=1)
-            if invert
-            else run_date_ts.replace(day=1)
-        )
-    elif run_type == "yearly":
-        run_date_convert_ts = (
-            run_date_ts.replace(month=1, day=1)
-            + relativedelta(years=1)
-            - relativedelta(days=1)
-            if invert
-            else run_date_ts.replace(month=1, day=1)
-        )
+    if converters := PROCESS_DATE_CONVERTERS.get(run_type):
+        run_date_convert_ts: date = converters[invert](run_date_ts)
     else:
-        run_date_convert_ts = run_date_ts
+        run_date_convert_ts: date = run_date_ts
     return (
         run_date_convert_ts.strftime(fmt)
         if date_type == "str"
@@ -191,8 +206,10 @@ def get_cal_date(
     return _result.strftime(fmt) if date_type == "str" else _result
 
 
+@functools.lru_cache(maxsize=256)
 def get_function(func_string: str) -> callable:
-    """Get function from imported string :usage: ..> get_function( ...
+    """Get function from imported string that will cache by this string
+    :usage: ..> get_function( ...
 
     func_string='vendor.replenishment.run_prod_cls_criteria'
     ... )
@@ -202,22 +219,62 @@ def get_function(func_string: str) -> callable:
     return getattr(mod, _function)
 
 
-def _get_config_filter_path(
-    path: str,
+@functools.lru_cache(maxsize=128)
+def get_function_parameters(func: callable) -> tuple[str, ...]:
+    """Get parameter names of function that will cache by function object.
+
+    Examples:
+        >>> get_function_parameters(lambda input_df, run_date: ...)
+        ('input_df', 'run_date')
+    """
+    return tuple(inspect.signature(func).parameters)
+
+
+@functools.lru_cache(maxsize=512)
+def _load_yaml(path: str, mtime_ns: int) -> dict:
+    """Load the YAML file that will cache by its path and modified time."""
+    return yaml.load(Path(path).read_bytes(), Loader=YamlLoader) or {}
+
+
+def load_yaml(path: str) -> dict:
+    """Return the copy of loaded data from YAML file. The file will parse again
+    only when it was modified.
+    """
+    return copy.deepcopy(_load_yaml(path, os.stat(path).st_mtime_ns))
+
+
+@functools.lru_cache(maxsize=64)
+def _get_config_filter_pattern(
     config_dir: str,
     config_prefix: Optional[str] = None,
     config_prefix_file: Optional[str] = None,
-) -> bool:
-    """Path filtering gateway of configuration directory."""
+) -> Optional[re.Pattern]:
+    """Return the compiled file name pattern of configuration directory."""
     if config_dir == "catalog":
         _conf_pre: str = config_prefix or ""
         _conf_pre_file: str = config_prefix_file or "catalog"
-        return fnmatch.fnmatch(path, f"{_conf_pre_file}_{_conf_pre}*.yaml")
+        _pattern: str = f"{_conf_pre_file}_{_conf_pre}*.yaml"
     elif config_dir in {"function", "view", "adhoc"}:
         _conf_pre_file: str = config_prefix_file or "*"
-        return fnmatch.fnmatch(path, f"{_conf_pre_file}_*.yaml")
+        _pattern: str = f"{_conf_pre_file}_*.yaml"
     elif config_dir == "pipeline":
-        return fnmatch.fnmatch(path, "pipeline_*.yaml")
+        _pattern: str = "pipeline_*.yaml"
+    else:
+        return None
+    return re.compile(fnmatch.translate(os.path.normcase(_pattern)))
+
+
+def _get_config_filter_path(
+    path: str,
+    config_dir: str,
+    config_prefix: Optional[str] = None,
+    config_prefix_file: Optional[str] = None,
+) -> bool:
+    """Path filtering gateway of configuration directory."""
+    if pattern := _get_config_filter_pattern(
+        config_dir, config_prefix, config_prefix_file
+    ):
+        return pattern.match(os.path.normcase(path)) is not None
     return False
 
 
@@ -274,34 +331,37 @@ class LoadCatalog:
         return _results
 
     @staticmethod
-    def sorted(results):
-        """Sorting version value method."""
-        return sorted(
+    def latest(results):
+        """Return the result that has the latest version value."""
+        return max(
             results,
             key=lambda x: datetime.fromisoformat(
                 x.get("version", "1990-01-01")
             ),
-            reverse=True,
         )
 
     def load(self):
         _results: list = []
-        for file in sorted(os.listdir(self.path), reverse=False):
-            if _get_config_filter_path(
-                file, self.folder, self.prefix, self.prefix_file
-            ):
-                with open(os.path.join(self.path, file), encoding="utf8") as f:
-                    _config_data: dict = yaml.load(f, Loader=yaml.Loader)
-                    _result: list = (
-                        self.filter_catalog_shortname(data=_config_data)
-                        if self.shortname
-                        else self.filter_catalog(data=_config_data)
-                    )
-                    if _result:
-                        _results.extend(_result)
-                    del _config_data
+        with os.scandir(self.path) as entries:
+            files: list[str] = sorted(
+                entry.path
+                for entry in entries
+                if entry.is_file()
+                and _get_config_filter_path(
+                    entry.name, self.folder, self.prefix, self.prefix_file
+                )
+            )
+        for file in files:
+            _config_data: dict = load_yaml(file)
+            _result: list = (
+                self.filter_catalog_shortname(data=_config_data)
+                if self.shortname
+                else self.filter_catalog(data=_config_data)
+            )
+            if _result:
+                _results.extend(_result)
         if _results:
-            return self.sorted(_results)[0]
+            return self.latest(_results)
         raise CatalogNotFound(
             f"Catalog {'shortname' if self.shortname else 'name'}: "
             f"{self.name!r} not found in "
@@ -318,36 +378,37 @@ def get_catalogs(
     """Get all raw configuration from .yaml file."""
     _key_exists: list = must_list(key_exists)
     _folder_config: list = must_list(config_form or CATALOGS)
-    conf_paths = (
-        (AI_APP_PATH / registers.path.conf / x, x) for x in _folder_config
+    conf_files = itertools.chain.from_iterable(
+        (
+            os.path.join(conf_path, file)
+            for file in sorted(os.listdir(conf_path))
+            if _get_config_filter_path(file, config_dir=fol_conf)
+        )
+        for conf_path, fol_conf in (
+            (AI_APP_PATH / registers.path.conf / x, x) for x in _folder_config
+        )
     )
     _files: dict = {}
-    for conf_path, fol_conf in conf_paths:
-        for file in sorted(os.listdir(conf_path), reverse=False):
-            if _get_config_filter_path(file, config_dir=fol_conf):
-                with open(os.path.join(conf_path, file), encoding="utf8") as f:
-                    _config_data_raw: dict = yaml.load(f, Loader=yaml.Loader)
-                    _config_data: dict = (
-                        {
-                            k: v
-                            for k, v in _config_data_raw.items()
-                            if _get_config_filter_key(
-                                _key_exists, v, all_mode=key_exists_all_mode
-                            )
-                        }
-                        if _key_exists
-                        else _config_data_raw
-                    )
-                    _files: dict = _files | _config_data
-                    del _config_data_raw, _config_data
+    for file in conf_files:
+        _config_data: dict = load_yaml(file)
+        _files.update(
+            (
+                (k, v)
+                for k, v in _config_data.items()
+                if _get_config_filter_key(
+                    _key_exists, v, all_mode=key_exists_all_mode
+                )
+            )
+            if _key_exists
+            else _config_data
+        )
     return sort_by_priority(_files) if priority_sorted else _files
 
 
 def split_datatype(datatype_full: str) -> tuple[str, str]:
-    for null_str in ["not null", "null"]:
-        if search := re.search(null_str, datatype_full):
-            _nullable: str = search[0].strip()
-            return datatype_full.replace(_nullable, "").strip(), _nullable
+    for null_str in ("not null", "null"):
+        if null_str in datatype_full:
+            return datatype_full.replace(null_str, "").strip(), null_str
     return datatype_full.strip(), "null"
 
 
@@ -360,4 +421,4 @@ def filter_ps_type(ps_name_full: str) -> tuple[str, str]:
 
 
 def filter_not_null(datatype: str) -> bool:
-    return all(not re.search(word, datatype) for word in ["default", "serial"])
+    return "default" not in datatype and "serial" not in datatype
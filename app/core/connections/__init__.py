@@ -1,7 +1,9 @@
+import re
 from typing import (
     Optional,
 )
 
+from ..utils.reusables import must_bool
 from .postgresql import (
     ParamType,
     query_execute,
@@ -13,30 +15,37 @@ from .postgresql import (
     query_transaction,
 )
 
+# NOTE: The statements that return the number of rows with `row_number` column.
+ROW_NUMBER_STATEMENT = re.compile(
+    r"select\s+count\(\s*(?:\*|1)\s*\)\s+as\s+row_number\s+from\s"
+    r"|func_count_if_exists",
+    re.IGNORECASE,
+)
+
 
 def query_select_check(
     statement: str,
     parameters: Optional[dict] = None,
 ) -> bool:
     """Enhance query function to get `check_exists` value from result."""
-    return eval(
-        query_select_one(statement, parameters=parameters)["check_exists"]
+    return must_bool(
+        query_select_one(statement, parameters=parameters)["check_exists"],
+        force_raise=True,
     )
 
 
 def query_select_row(
     statement: str,
     parameters: Optional[dict] = None,
+    bind_values: Optional[dict] = None,
 ) -> int:
     """Enhance query function to get `row_number` value from result."""
-    if any(
-        _ in statement.lower()
-        for _ in {
-            "select count(*) as row_number from ",
-            "func_count_if_exists",
-        }
-    ):
+    if ROW_NUMBER_STATEMENT.search(statement):
         return int(
-            query_select_one(statement, parameters=parameters)["row_number"]
+            query_select_one(
+                statement, parameters=parameters, bind_values=bind_values
+            )["row_number"]
         )
-    return query_execute_row(statement, parameters=parameters)
+    return query_execute_row(
+        statement, parameters=parameters, bind_values=bind_values
+    )
@@ -4,10 +4,11 @@
 # license information.
 # ------------------------------------------------------------------------------
 
-import csv
 import json
 import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from typing import (
+    Iterator,
     Optional,
     Union,
 )
@@ -15,10 +16,7 @@ from typing import (
 from app.core.errors import WriteCSVError
 from app.core.utils.config import Params
 from app.core.utils.logging_ import logging
-from app.core.utils.reusables import (
-    path_join,
-    rows,
-)
+from app.core.utils.reusables import path_join
 
 AI_APP_PATH: str = os.getenv(
     "AI_APP_PATH", path_join(os.path.dirname(__file__), "../../..")
@@ -28,6 +26,9 @@ registers = Params(param_name="registers.yaml")
 
 logger = logging.getLogger(__name__)
 
+# NOTE: Buffer size for copying file content with large blocks.
+COPY_BUFFER_SIZE: int = 1 << 20
+
 
 def load_json_to_values(
     filepath: Union[str, list], schema: Optional[list] = None
@@ -35,7 +36,9 @@ def load_json_to_values(
     _filepath: list = [filepath] if isinstance(filepath, str) else filepath
     _results: list = []
 
-    def _repr_value(content: str):
+    def _repr_value(content) -> str:
+        if not isinstance(content, str):
+            return str(content)
         return (
             "null"
             if content == "null"
@@ -45,57 +48,58 @@ def load_json_to_values(
     for _path in _filepath:
         with open(
             path_join(AI_APP_PATH, f"{registers.path.data}/{_path}"),
-            encoding="utf-8",
+            mode="rb",
         ) as read_file:
             data: Union[dict, list] = json.load(read_file)
-            _data: list = [data] if isinstance(data, dict) else data
-        _fix_cols: list = schema or list(_data[0].copy().keys())
+        _data: list = [data] if isinstance(data, dict) else data
+        _fix_cols: list = schema or list(_data[0])
         _results.extend(
-            [
-                ", ".join(
-                    [
-                        (
-                            _repr_value(_content)
-                            if isinstance(
-                                (_content := row.get(col, "null")), str
-                            )
-                            else str(_content)
-                        )
-                        for col in _fix_cols
-                    ]
-                )
-                for row in _data
-            ]
+            ", ".join([_repr_value(row.get(col, "null")) for col in _fix_cols])
+            for row in _data
         )
     return _results
 
 
-def zip_(folder: str, filename: str, filter_: callable):
-    from zipfile import ZipFile
+def scan_files(folder: str) -> Iterator[os.DirEntry]:
+    """Yield all file entries in the folder and its sub-folders."""
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from scan_files(entry.path)
+            elif entry.is_file():
+                yield entry
+
+
+def zip_(
+    folder: str,
+    filename: str,
+    filter_: callable,
+    compresslevel: int = 1,
+):
+    from zipfile import ZIP_DEFLATED, ZipFile
 
     # create a ZipFile object
-    with ZipFile(filename, "w") as zipObj:
+    with ZipFile(
+        filename, "w", ZIP_DEFLATED, compresslevel=compresslevel
+    ) as zipObj:
+        write = zipObj.write
         # Iterate over all the files in directory
-        for folder_, _sub_folder, filenames in os.walk(folder):
-            for filename in filenames:
-                if filter_(filename):
-                    # create complete filepath of file in directory
-                    filepath = os.path.join(folder_, filename)
-                    # Add file to zip
-                    zipObj.write(filepath, os.path.basename(filepath))
+        for entry in scan_files(folder):
+            if filter_(entry.name):
+                # Add file to zip
+                write(entry.path, entry.name)
+
+
+# NOTE: Translate table that remove double quote and replace comma with
+#   underscore in one pass.
+PREPARE_TRANS: dict[int, Optional[str]] = str.maketrans({'"': None, ",": "_"})
 
 
 def prepare_data(row: str, delimiter: str) -> list:
     """Prepare data logic with row by row."""
-    data: list = []
-    append = data.append
-    for col in iter(row.split(delimiter)):
-        _col: str = (
-            col.strip().replace('"', "").replace("'", "'").replace(",", "_")
-        )
-        # append(''.join(_ for _ in col if _.isalnum()))
-        append(_col)
-    return data
+    return [
+        col.strip().translate(PREPARE_TRANS) for col in row.split(delimiter)
+    ]
 
 
 def prepare_csv(
@@ -114,6 +118,7 @@ def prepare_csv(
         open(
             path_join(AI_APP_PATH, f"{registers.path.data_landing}/{filename}"),
             encoding="utf-8-sig",
+            buffering=chunk_size << 10,
         ) as read_file,
         open(
             path_join(AI_APP_PATH, f"{registers.path.data_success}/{filename}"),
@@ -122,19 +127,29 @@ def prepare_csv(
             newline="",
         ) as write_file,
     ):
-        writer = csv.writer(write_file, delimiter="|", quoting=csv.QUOTE_NONE)
+        write = write_file.write
         _row_count: int = 0
-        for row in rows(read_file, chunk_size=chunk_size, sep="\n"):
-            try:
-                if row == "":
-                    continue
-                writer.writerow(prepare_data(row, delimiter=delimiter))
-                _row_count += 1
-            except csv.Error as err_stt:
-                # TODO: move error record to error folder
+        for row in read_file:
+            if (row := row.rstrip("\n")) == "":
+                continue
+            _data: list = prepare_data(row, delimiter=delimiter)
+            _line: str = "|".join(_data)
+            # NOTE: Raise the same errors of the csv writer without quoting.
+            #   Any field that contain the pipe or line break characters can
+            #   not write, and a row of one empty field can not write too.
+            # TODO: move error record to error folder
+            if _line == "":
                 raise WriteCSVError(
-                    f"csv.Error: {err_stt}. with row value: {row!r}"
-                ) from err_stt
+                    "csv.Error: single empty field record must be quoted. "
+                    f"with row value: {row!r}"
+                )
+            if _line.count("|") >= len(_data) or "\r" in _line:
+                raise WriteCSVError(
+                    "csv.Error: need to escape, but no escapechar set. "
+                    f"with row value: {row!r}"
+                )
+            write(_line + "\r\n")
+            _row_count += 1
         if compress:
             logger.warning("Compress option does not support yet")
         logger.info(
@@ -145,15 +160,29 @@ def prepare_csv(
     )
 
 
-def load_file_from_landing():
-    for file_name in os.listdir(
+def list_landing_files() -> list[str]:
+    """Return all file names in the landing folder without any sub-folder."""
+    with os.scandir(
         path_join(AI_APP_PATH, registers.path.data_landing)
-    ):
-        prepare_csv(file_name)
+    ) as entries:
+        return [entry.name for entry in entries if entry.is_file()]
+
+
+def load_file_from_landing(max_workers: Optional[int] = None):
+    """Prepare all files in the landing folder in parallel processes, because
+    each file is independent and the preparing logic is CPU bound.
+    """
+    if len(file_names := list_landing_files()) <= 1:
+        for file_name in file_names:
+            prepare_csv(file_name)
+        return
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(prepare_csv, file_names))
 
 
-def convert_to_gzip(filename: str):
+def convert_to_gzip(filename: str, compresslevel: int = 9):
     import gzip
+    import mmap
 
     _filenames = filename.rsplit(".", maxsplit=1)
     _filenames.insert(-1, "gz")
@@ -169,21 +198,57 @@ def convert_to_gzip(filename: str):
                 AI_APP_PATH, f"{registers.path.data_success}/{filename_out}"
             ),
             mode="wb",
+            compresslevel=compresslevel,
         ) as write_file,
     ):
-        write_file.writelines(read_file)
+        if (size := os.fstat(read_file.fileno()).st_size) > 0:
+            # NOTE: Map the source file to memory and pass the large slices
+            #   to the compressor without copying to the read buffer.
+            with (
+                mmap.mmap(
+                    read_file.fileno(), 0, access=mmap.ACCESS_READ
+                ) as mapped,
+                memoryview(mapped) as view,
+            ):
+                for offset in range(0, size, COPY_BUFFER_SIZE):
+                    write_file.write(view[offset : offset + COPY_BUFFER_SIZE])
         logger.info(f"Success convert file {filename!r} to gzip compression")
     os.remove(
         path_join(AI_APP_PATH, f"{registers.path.data_landing}/{filename}")
     )
 
 
-def convert_file_from_landing(compress: str):
-    for file_name in os.listdir(
-        path_join(AI_APP_PATH, registers.path.data_landing)
-    ):
-        if compress in {"gzip", "gz"}:
-            convert_to_gzip(file_name)
+def move_to_success(filename: str):
+    """Move file from the landing folder to the success folder without any
+    converting. The `shutil.move` will rename the file if both folders are in
+    the same file system, otherwise it copies the file content by the kernel
+    with `os.sendfile` on Linux.
+    """
+    import shutil
+
+    shutil.move(
+        path_join(AI_APP_PATH, f"{registers.path.data_landing}/{filename}"),
+        path_join(AI_APP_PATH, f"{registers.path.data_success}/{filename}"),
+    )
+    logger.info(f"Success move file {filename!r} to success folder")
+
+
+def convert_file_from_landing(
+    compress: Optional[str],
+    max_workers: Optional[int] = None,
+):
+    """Convert all files in the landing folder in parallel threads, because
+    zlib releases the GIL while it compresses the data. If the compress value
+    is None, it will move all files to the success folder without converting.
+    """
+    if compress is None:
+        convert = move_to_success
+    elif compress in {"gzip", "gz"}:
+        convert = convert_to_gzip
+    else:
+        return
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(convert, list_landing_files()))
 
 
 if __name__ == "__main__":
@@ -4,12 +4,19 @@
 # license information.
 # ------------------------------------------------------------------------------
 
-import asyncio
+import bz2
+import contextlib
+import csv
 import functools
+import gzip
+import lzma
+import os
 import warnings
 
+import asyncpg
 import pandas as pd
 from cryptography.utils import CryptographyDeprecationWarning
+from psycopg2 import sql
 
 with warnings.catch_warnings():
     warnings.filterwarnings(
@@ -18,8 +25,9 @@ with warnings.catch_warnings():
     )
     from sshtunnel import SSHTunnelForwarder
 
-from collections.abc import Iterator
+from collections.abc import AsyncIterator, Iterator
 from typing import (
+    IO,
     Optional,
     Union,
 )
@@ -28,13 +36,14 @@ from sqlalchemy import (
     create_engine,
     text,
 )
+from sqlalchemy.engine import Engine
 from sqlalchemy.engine.url import URL
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.sql.elements import TextClause
 
 from app.core.errors import DatabaseProcessError
 from app.core.utils.config import Environs
-from app.core.utils.reusables import chunks
+from app.core.utils.reusables import must_bool
 
 env = Environs()
 
@@ -42,6 +51,31 @@ ParamType: type = Optional[Union[dict, bool]]
 
 DRIVER: str = env.DB_DRIVER or "postgresql+psycopg2"
 
+SSH_FLAG: bool = must_bool(env.get("SSH_FLAG", "False"))
+
+# NOTE: The database parameters that pass to all statements, these values do
+#   not change after the environment variables were loaded.
+DB_PARAMS: dict[str, str] = {
+    "database_name": "database" if "sqlite" in DRIVER else env.DB_NAME,
+    "ai_schema_name": env.get("AI_SCHEMA", "ai"),
+    "main_schema_name": env.get("MAIN_SCHEMA", "public"),
+}
+
+# NOTE: Mapping of compression type and the opener function, and the file
+#   extension that use to infer its compression type.
+COMPRESS_OPENERS: dict[str, callable] = {
+    "gzip": gzip.open,
+    "bz2": bz2.open,
+    "xz": lzma.open,
+}
+COMPRESS_SUFFIXES: dict[str, str] = {".gz": "gzip", ".bz2": "bz2", ".xz": "xz"}
+
+# NOTE: Buffer size of reading file that pass to the COPY statement.
+COPY_BUFFER_SIZE: int = 1 << 20
+
+# NOTE: Number of rows that fetch from the server-side cursor per batch.
+STREAM_SIZE: int = 1000
+
 
 def generate_url(
     conf_replace: Optional[dict] = None,
@@ -63,20 +97,31 @@ def generate_url(
 def query_format(
     statement: Union[str, list], parameters: ParamType
 ) -> Union[str, list]:
-    database_name: str = "database" if "sqlite" in DRIVER else env.DB_NAME
-    _db_param = {
-        "database_name": database_name,
-        "ai_schema_name": env.get("AI_SCHEMA", "ai"),
-        "main_schema_name": env.get("MAIN_SCHEMA", "public"),
-    }
     if isinstance(parameters, bool):
-        if parameters:
-            parameters: ParamType = {}
-        else:
+        if not parameters:
             return statement
+        _params: dict = DB_PARAMS
+    else:
+        _params: dict = DB_PARAMS | parameters
     if isinstance(statement, str):
-        return statement.format(**(_db_param | parameters))
-    return [_state.format(**(_db_param | parameters)) for _state in statement]
+        return statement.format_map(_params)
+    return [_state.format_map(_params) for _state in statement]
+
+
+@functools.lru_cache(maxsize=256)
+def prepare_statement(statement: str) -> TextClause:
+    """Return the cached text clause of the formatted statement, so the same
+    statement does not re-parse its bind parameters on every call.
+    """
+    return text(statement)
+
+
+@functools.lru_cache(maxsize=16)
+def get_engine(url: URL) -> Engine:
+    """Return the database engine that will cache by its URL, so the queries
+    will reuse the connections in the same engine pool.
+    """
+    return create_engine(url, pool_pre_ping=True)
 
 
 def ssh_connect():
@@ -105,7 +150,7 @@ def convert_local(function: callable) -> callable:
 
     @functools.wraps(function)
     def wrapper(*args, **kwargs):
-        if eval(env.get("SSH_FLAG", "False")):
+        if SSH_FLAG:
             server = ssh_connect()
             if not server.is_alive:
                 server.start()
@@ -140,10 +185,10 @@ def query_select(
     statement: str,
     conf_replace: Optional[dict] = None,
     parameters: ParamType = None,
+    bind_values: Optional[dict] = None,
+    dtype: Optional[str] = "str",
 ) -> Iterator[dict]:
-    engine = create_engine(
-        generate_url(conf_replace=conf_replace), pool_pre_ping=True
-    )
+    engine = get_engine(generate_url(conf_replace=conf_replace))
     _statement: str = (
         query_format(statement, parameters)
         if parameters is not None
@@ -152,18 +197,20 @@ def query_select(
     with engine.connect() as conn:
         with conn.begin():
             try:
-                output_df = pd.read_sql_query(
-                    text(_statement),
-                    con=conn,
-                    dtype="str",
-                )
+                result = conn.execution_options(
+                    stream_results=True, yield_per=STREAM_SIZE
+                ).execute(prepare_statement(_statement), bind_values)
+                columns: tuple[str, ...] = tuple(result.keys())
+                for row in result:
+                    yield dict(
+                        zip(columns, map(str, row) if dtype == "str" else row)
+                    )
             except SQLAlchemyError as error:
                 raise DatabaseProcessError(
                     f"{type(error).__module__}:{type(error).__name__}: "
                     f"{str(error.__dict__['orig'])}"
                     f" \nWith statement: \n{_statement}"
                 ) from error
-        yield from output_df.to_dict(orient="index").values()
 
 
 @convert_local
@@ -172,10 +219,7 @@ def query_select_df(
     conf_replace: Optional[dict] = None,
     parameters: ParamType = None,
 ) -> pd.DataFrame:
-    engine = create_engine(
-        generate_url(conf_replace=conf_replace),
-        pool_pre_ping=True,
-    )
+    engine = get_engine(generate_url(conf_replace=conf_replace))
     _statement: str = (
         query_format(statement, parameters)
         if parameters is not None
@@ -203,11 +247,9 @@ def query_select_one(
     statement: str,
     conf_replace: Optional[dict] = None,
     parameters: ParamType = None,
+    bind_values: Optional[dict] = None,
 ) -> dict:
-    engine = create_engine(
-        generate_url(conf_replace=conf_replace),
-        pool_pre_ping=True,
-    )
+    engine = get_engine(generate_url(conf_replace=conf_replace))
     _statement: str = (
         query_format(statement, parameters)
         if parameters is not None
@@ -216,66 +258,108 @@ def query_select_one(
     with engine.connect() as conn:
         try:
             with conn.begin():
-                output_df = pd.read_sql_query(
-                    text(_statement), con=conn, dtype="str"
+                result = conn.execute(
+                    prepare_statement(_statement), bind_values
                 )
+                columns: tuple[str, ...] = tuple(result.keys())
+                row = result.first()
         except SQLAlchemyError as error:
             raise DatabaseProcessError(
                 f"{type(error).__module__}:{type(error).__name__}: "
                 f"{str(error.__dict__['orig'])}"
                 f" \nWith statement: \n{_statement}"
             ) from error
-    return output_df.to_dict(orient="index").get(0, {})
+    return {} if row is None else dict(zip(columns, map(str, row)))
+
+
+def open_csv(
+    filepath: str,
+    encoding: str = "utf-8",
+    compress: Optional[str] = None,
+) -> IO[str]:
+    """Open the csv file with text mode that decompress by `compress` value or
+    infer it from the file extension if it does not set or equal `infer`.
+    """
+    compression: Optional[str] = (
+        COMPRESS_SUFFIXES.get(os.path.splitext(filepath)[-1])
+        if compress in (None, "infer")
+        else compress
+    )
+    if compression is None:
+        return open(filepath, encoding=encoding, newline="")
+    elif compression not in COMPRESS_OPENERS:
+        raise ValueError(f"Compression {compression!r} does not support")
+    return COMPRESS_OPENERS[compression](
+        filepath, mode="rt", encoding=encoding, newline=""
+    )
 
 
 @convert_local
 def query_insert_from_csv(
     file_properties: dict,
     conf_replace: Optional[dict] = None,
-    chunk_size: int = 10000,
     truncate: bool = False,
     compress: Optional[str] = None,
-):
-    """
+) -> int:
+    """Stream the csv file to the table with `COPY ... FROM STDIN` statement
+    in one transaction, and return the number of copied rows. The columns
+    map by the header line of this file, and all names and the delimiter
+    will quote before pass to the statement.
+
     :file_properties:
         file_path: '/data/success/<file_name>.csv
         target: '<schema_name>.<table_name>'
         props:
             delimiter: '<delimiter>'
-            engine: 'python'
+            encoding: '<encoding>'
     """
-    engine = create_engine(
-        generate_url(conf_replace=conf_replace),
-        pool_pre_ping=True,
+    engine = get_engine(generate_url(conf_replace=conf_replace))
+    _props: dict = file_properties["props"]
+    _delimiter: str = _props.get("delimiter", ",")
+    _table: sql.Identifier = sql.Identifier(
+        env.get("AI_SCHEMA", "ai"), file_properties["table"]
     )
-    with engine.connect() as conn:
-        with conn.begin():
-            file_df = pd.read_csv(
-                file_properties["filepath"],
-                encoding=file_properties["props"].get("encoding", "utf-8"),
-                delimiter=file_properties["props"].get("delimiter", ","),
-                engine=file_properties["props"].get("engine", "python"),
-                compression=(compress or "infer"),
+    conn = engine.raw_connection()
+    try:
+        with (
+            open_csv(
+                str(file_properties["filepath"]),
+                encoding=_props.get("encoding", "utf-8"),
+                compress=compress,
+            ) as file,
+            conn.cursor() as cursor,
+        ):
+            _columns: list[str] = next(
+                csv.reader(
+                    [file.readline().lstrip("\ufeff")], delimiter=_delimiter
+                )
             )
-            if_exists_param: str = "append"
-            for idx, chunk in enumerate(chunks(file_df, chunk_size)):
-                if truncate:
-                    if_exists_param = "replace" if idx == 0 else "append"
-                try:
-                    chunk.to_sql(
-                        con=engine,
-                        name=file_properties["table"],
-                        schema=env.get("AI_SCHEMA", "ai"),
-                        if_exists=if_exists_param,
-                        index=False,
-                    )
-
-                except SQLAlchemyError as error:
-                    raise DatabaseProcessError(
-                        f"{type(error).__module__}:{type(error).__name__}: "
-                        f"{str(error.__dict__['orig'])}"
-                    ) from error
-                yield (idx + 1) * chunk_size, len(chunk)
+            if truncate:
+                cursor.execute(sql.SQL("TRUNCATE TABLE {}").format(_table))
+            cursor.copy_expert(
+                sql.SQL(
+                    "COPY {} ( {} ) FROM STDIN "
+                    "WITH ( FORMAT csv, DELIMITER {} )"
+                )
+                .format(
+                    _table,
+                    sql.SQL(", ").join(map(sql.Identifier, _columns)),
+                    sql.Literal(_delimiter),
+                )
+                .as_string(cursor),
+                file,
+                size=COPY_BUFFER_SIZE,
+            )
+            _rows: int = cursor.rowcount
+        conn.commit()
+    except engine.dialect.dbapi.Error as error:
+        conn.rollback()
+        raise DatabaseProcessError(
+            f"{type(error).__module__}:{type(error).__name__}: {error}"
+        ) from error
+    finally:
+        conn.close()
+    return _rows
 
 
 @convert_local
@@ -284,10 +368,7 @@ def query_execute(
     conf_replace: Optional[dict] = None,
     parameters: ParamType = None,
 ) -> None:
-    engine = create_engine(
-        generate_url(conf_replace=conf_replace),
-        pool_pre_ping=True,
-    )
+    engine = get_engine(generate_url(conf_replace=conf_replace))
     _statement: Union[str, list] = (
         query_format(statement, parameters)
         if parameters is not None
@@ -314,11 +395,9 @@ def query_execute_row(
     statement: Union[str, list],
     conf_replace: Optional[dict] = None,
     parameters: ParamType = None,
+    bind_values: Optional[dict] = None,
 ) -> int:
-    engine = create_engine(
-        generate_url(conf_replace=conf_replace),
-        pool_pre_ping=True,
-    )
+    engine = get_engine(generate_url(conf_replace=conf_replace))
     _statement: Union[str, list] = (
         query_format(statement, parameters)
         if parameters is not None
@@ -331,7 +410,9 @@ def query_execute_row(
             for _state in (
                 _statement if isinstance(_statement, list) else [_statement]
             ):
-                return conn.execute(text(_state)).rowcount
+                return conn.execute(
+                    prepare_statement(_state), bind_values
+                ).rowcount
         except SQLAlchemyError as error:
             raise DatabaseProcessError(
                 f"{type(error).__module__}:{type(error).__name__}: "
@@ -346,9 +427,7 @@ def query_transaction(
     conf_replace: Optional[dict] = None,
     parameters: ParamType = None,
 ) -> int:
-    engine = create_engine(
-        generate_url(conf_replace=conf_replace), pool_pre_ping=True
-    )
+    engine = get_engine(generate_url(conf_replace=conf_replace))
     _statement: Union[str, list] = (
         query_format(statement, parameters)
         if parameters is not None
@@ -371,27 +450,73 @@ def query_transaction(
                 ) from error
 
 
+def generate_async_dsn(conf_replace: Optional[dict] = None) -> str:
+    """Generate the database DSN that asyncpg can connect."""
+    return (
+        generate_url(conf_replace=conf_replace)
+        .set(drivername="postgresql")
+        .render_as_string(hide_password=False)
+    )
+
+
+@convert_local
+@contextlib.asynccontextmanager
+async def async_pool(
+    conf_replace: Optional[dict] = None,
+    max_size: int = 10,
+) -> AsyncIterator[asyncpg.Pool]:
+    """Create the asyncpg connection pool that share to all async queries in
+    this context and close it with all its connections when the context exit.
+
+    usage:
+        async with async_pool() as pool:
+            await asyncio.gather(
+                query_execute_async(statement_1, pool=pool),
+                query_execute_async(statement_2, pool=pool),
+            )
+    """
+    pool: asyncpg.Pool = await asyncpg.create_pool(
+        dsn=generate_async_dsn(conf_replace=conf_replace),
+        min_size=1,
+        max_size=max_size,
+    )
+    try:
+        yield pool
+    finally:
+        await pool.close()
+
+
+@contextlib.asynccontextmanager
+async def async_connect(
+    conf_replace: Optional[dict] = None,
+) -> AsyncIterator[asyncpg.Connection]:
+    """Open one asyncpg connection and close it when the context exit."""
+    conn: asyncpg.Connection = await asyncpg.connect(
+        dsn=generate_async_dsn(conf_replace=conf_replace)
+    )
+    try:
+        yield conn
+    finally:
+        await conn.close()
+
+
 @convert_local
 async def query_execute_async(
     statement: Union[str, list],
     conf_replace: Optional[dict] = None,
+    pool: Optional[asyncpg.Pool] = None,
 ) -> None:
-    """
+    """Execute statements on the connection from the pool if it passes,
+    otherwise it opens the connection that will close after all statements
+    were executed.
+
     usage:
         asyncio.run(query_execute_async('select * from ai.ctr_data_pipeline'))
     """
-    engine = create_async_engine(
-        generate_url(conf_replace=conf_replace, driver="asyncpg"),
-        echo=False,
-        pool_pre_ping=True,
-    )
-
-    # Pause the execution of the function for a short period of time
-    # await asyncio.sleep(0.1)
-    async with engine.execution_options(
-        isolation_level="AUTOCOMMIT"
-    ).connect() as conn:
-        async with conn.begin():
-            await conn.execute(text(statement))
-    await engine.dispose()
-    await asyncio.sleep(0.1)
+    async with (
+        async_connect(conf_replace=conf_replace)
+        if pool is None
+        else pool.acquire()
+    ) as conn:
+        for _state in statement if isinstance(statement, list) else [statement]:
+            await conn.execute(_state)
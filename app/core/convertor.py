@@ -7,8 +7,8 @@ from __future__ import annotations
 
 import datetime as dt
 import re
-from itertools import compress
-from typing import Any, Literal, Optional, Union
+from collections import Counter
+from typing import Any, Collection, Iterator, Literal, Optional, Union
 
 from .errors import (
     ColumnsNotEqualError,
@@ -20,11 +20,73 @@ from .errors import (
     TableArgumentError,
 )
 
+# NOTE: The pre-compiled patterns of the statement that use on every generated
+#   statement.
+PARAM_PATTERN: re.Pattern = re.compile(r"{([^{}]+?)}")
+
+# NOTE: The keywords that come before the target and source table names.
+TARGET_KEYWORDS: frozenset[str] = frozenset(
+    {"insert into", "update", "delete from"}
+)
+SOURCE_KEYWORDS: frozenset[str] = frozenset(
+    {"from", "join", "left join", "right join", "cross join", "full join"}
+)
+TARGET_SOURCE_PATTERN: re.Pattern = re.compile(
+    "("
+    + "|".join(
+        sorted(TARGET_KEYWORDS | SOURCE_KEYWORDS, key=lambda x: (-len(x), x))
+    )
+    + r") {database_name}\.{ai_schema_name}\.(\w+)"
+)
+
+# NOTE: The source keywords search separately, because the `from` keyword of
+#   the `delete from` target also be the source of that statement.
+SOURCE_PATTERN: re.Pattern = re.compile(
+    "("
+    + "|".join(sorted(SOURCE_KEYWORDS, key=lambda x: (-len(x), x)))
+    + r") {database_name}\.{ai_schema_name}\.(\w+)"
+)
+
+# NOTE: Mapping of the statement prefix and its statement type, Data Query
+#   Language, Data Manipulation Language, Data Definition Language, and Data
+#   Control Language.
+STATEMENT_TYPES: dict[str, str] = {
+    "select": "dql",
+    "insert into": "dml",
+    "update": "dml",
+    "delete from": "dml",
+    "merge": "dml",
+    "create": "ddl",
+    "alter": "ddl",
+    "drop": "ddl",
+    "truncate": "ddl",
+    "rename": "ddl",
+    "grant": "dcl",
+    "revoke": "dcl",
+}
+STATEMENT_TYPE_PATTERN: re.Pattern = re.compile(
+    "|".join(map(re.escape, STATEMENT_TYPES))
+)
+
+# NOTE: The keywords of sub SQL query that do not allow in the payload values.
+SQL_INJECT_KEYWORDS: tuple[str, ...] = (
+    "drop ",
+    "select ",
+    "delete ",
+    "insert ",
+)
+
+# NOTE: Translate table that escape the single quote of the string value.
+QUOTE_TRANS: dict[int, str] = str.maketrans({"'": "''"})
+
+# NOTE: The parameters that will pass from the database connection.
+RESERVED_PARAMS: frozenset[str] = frozenset({"database_name", "ai_schema_name"})
+
 
 def reduce_stm(stm: str, add_row_number: bool = False) -> str:
     """Reduce statement and prepare statement if it wants to catch number of
     result."""
-    _reduce_stm: str = " ".join(stm.replace("\t", " ").split()).strip()
+    _reduce_stm: str = " ".join(stm.split())
     if add_row_number:
         _split_stm: list = _reduce_stm.split(";")
         _last_stm: str = _split_stm.pop(-1)
@@ -66,15 +128,8 @@ class Statement:
     be that set statement.
     """
 
-    target_list: tuple = ("insert into", "update", "delete from")
-    source_list: tuple = (
-        "from",
-        "join",
-        "left join",
-        "right join",
-        "cross join",
-        "full join",
-    )
+    target_list: frozenset[str] = TARGET_KEYWORDS
+    source_list: frozenset[str] = SOURCE_KEYWORDS
 
     __slots__ = (
         "stm_statement",
@@ -82,6 +137,10 @@ class Statement:
         "stm_add_row_num",
         "stm_result",
         "stm_generate_flg",
+        "stm_matches",
+        "stm_sources",
+        "stm_type",
+        "stm_param_names",
     )
 
     def __init__(
@@ -96,6 +155,10 @@ class Statement:
         self.stm_add_row_num: bool = add_row_number
         self.stm_result: str = ""
         self.stm_generate_flg: bool = False
+        self.stm_matches: Optional[list[tuple[str, str]]] = None
+        self.stm_sources: Optional[list[tuple[str, str]]] = None
+        self.stm_type: Optional[str] = None
+        self.stm_param_names: Optional[list[str]] = None
 
     def __repr__(self):
         return f"{self.__class__.__name__}(statement={self.stm_statement})"
@@ -109,26 +172,24 @@ class Statement:
 
     @property
     def type(self) -> str:
-        if not self.stm_generate_flg:
-            self.generate()
-        if "select count(*) as row_number from " in self.stm_result:
-            return "dql"
-        return self._check_type(self.stm_result)
+        if self.stm_type is None:
+            _result: str = self.generate()
+            self.stm_type = (
+                "dql"
+                if "select count(*) as row_number from " in _result
+                else self._check_type(_result)
+            )
+        return self.stm_type
 
     @property
     def stm_params(self) -> list[str]:
-        if not self.stm_generate_flg:
-            self.generate()
-        _params_all = re.findall(r"{([^{}]+?)}", self.stm_result)
-        return [
-            param
-            for param in _params_all
-            if param
-            not in {
-                "database_name",
-                "ai_schema_name",
-            }
-        ]
+        if self.stm_param_names is None:
+            self.stm_param_names = [
+                param
+                for param in PARAM_PATTERN.findall(self.generate())
+                if param not in RESERVED_PARAMS
+            ]
+        return self.stm_param_names
 
     @staticmethod
     def add_row_num(stm: str, include_with: bool = True) -> str:
@@ -147,6 +208,7 @@ class Statement:
 
     def _generate(self) -> str:
         """Generate statement from string type."""
+        _results: list[str] = []
         for _stm_name, _stm_sub_stm in self.stm_statement.items():
             if not isinstance(_stm_sub_stm, str):
                 raise TableArgumentError(
@@ -163,52 +225,42 @@ class Statement:
                     else f"{_tbl_alias} as ( {_reduce_stm} )"
                 )
                 if _tbl_alias == "row_table" and not self.stm_add_row_num:
-                    self.stm_result += f" {tbl_alias_stm}"
+                    _results.append(f" {tbl_alias_stm}")
                 else:
-                    self.stm_result += f"{self.stm_with_prefix} {tbl_alias_stm}"
+                    _results.append(f"{self.stm_with_prefix} {tbl_alias_stm}")
                 continue
 
             self.stm_with_count: int = 0
-            self.stm_result += (
+            _results.append(
                 f"{_reduce_stm}{'' if _reduce_stm.endswith(';') else ';'} "
             )
+        self.stm_result: str = "".join(_results)
         self.stm_generate_flg: bool = True
         return self.stm_result
 
     def generate(self) -> str:
         return self.stm_result if self.stm_generate_flg else self._generate()
 
+    def matches(self) -> list[tuple[str, str]]:
+        """Return all pairs of the keyword and table name of the target and
+        source tables in the generated statement that will search only once.
+        """
+        if self.stm_matches is None:
+            self.stm_matches = TARGET_SOURCE_PATTERN.findall(self.generate())
+        return self.stm_matches
+
     def target(self) -> set:
-        return set(
-            re.findall(
-                (
-                    r"(insert into|update|delete from) "
-                    r"{database_name}\.{ai_schema_name}\.(\w+)"
-                ),
-                self.generate(),
-            )
-        )
+        return {
+            match for match in self.matches() if match[0] in self.target_list
+        }
 
     def source(self) -> set:
-        return set(
-            re.findall(
-                (
-                    r"(from|join|left join|right join|cross join|full join) "
-                    r"{database_name}\.{ai_schema_name}\.(\w+)"
-                ),
-                self.generate(),
-            )
-        )
+        if self.stm_sources is None:
+            self.stm_sources = SOURCE_PATTERN.findall(self.generate())
+        return set(self.stm_sources)
 
     def mapping(self) -> dict[int, tuple[str]]:
-        find_list: list = re.findall(
-            (
-                r"(insert into|update|delete from|from|join|left join"
-                r"|right join|cross join|full join) "
-                r"{database_name}\.{ai_schema_name}\.(\w+)"
-            ),
-            self.generate(),
-        )
+        find_list: list = self.matches()
         _mapping: dict = {}
         _target: Optional[str] = None
         _residue: list = []
@@ -232,39 +284,8 @@ class Statement:
     def _check_type(
         statement: str,
     ) -> Literal["dql", "dml", "ddl", "dcl", "undefined"]:
-        _statement: str = statement.strip()
-        if _statement.startswith("select"):
-            # Data Query Language
-            return "dql"
-        elif _statement.startswith(
-            (
-                "insert into",
-                "update",
-                "delete from",
-                "merge",
-            )
-        ):
-            # Data Manipulation Language
-            return "dml"
-        elif _statement.startswith(
-            (
-                "create",
-                "alter",
-                "drop",
-                "truncate",
-                "rename",
-            )
-        ):
-            # Data Definition Language
-            return "ddl"
-        elif _statement.startswith(
-            (
-                "grant",
-                "revoke",
-            )
-        ):
-            # Data Control Language
-            return "dcl"
+        if matched := STATEMENT_TYPE_PATTERN.match(statement.lstrip()):
+            return STATEMENT_TYPES[matched.group(0)]
         return "undefined"
 
 
@@ -305,10 +326,18 @@ class Value:
         self.vl_action: str = action or "insert"  # update
         self.expected_cols: dict[str, Any] = expected_cols or {}
         self.vl_expected_pk: list[str] = expected_pk or []
+        self.vl_cols_expected: tuple[str, ...] = tuple(
+            k for k, v in self.expected_cols.items() if v.default is None
+        )
+        self.vl_cols_nullable: list[str] = [
+            k for k, v in self.expected_cols.items() if v.nullable
+        ]
         self.vl_update_date: str = (
             update_date
             if isinstance(update_date, str)
-            else update_date.strftime("%Y-%m-%d %H:%M:%S")
+            else update_date.replace(tzinfo=None).isoformat(
+                sep=" ", timespec="seconds"
+            )
         )
 
     def generate(self) -> tuple:
@@ -319,35 +348,27 @@ class Value:
 
     @staticmethod
     def validate_col_duplicate(columns: list):
-        distinct = set()
-        col_duplicates: list = [
-            _col for _col in columns if _col in distinct or distinct.add(_col)
-        ]
         if len(columns) != len(set(columns)):
+            col_duplicates: list = [
+                _col for _col, count in Counter(columns).items() if count > 1
+            ]
             raise DuplicateColumnError(
                 f"Data column was duplicated with {col_duplicates}. "
                 f"Please check column name in payloads"
             )
 
-    def validate_col_nullable(self, columns: list):
-        if self.vl_action != "update" and any(
-            not_found := [
-                (k not in columns) if v.nullable else False
-                for k, v in self.expected_cols.items()
-            ]
-        ):
-            _raise: list = list(
-                compress(
-                    list(self.expected_cols.keys()),
-                    (not x for x in not_found),
-                )
-            )
+    def validate_col_nullable(self, columns: Collection[str]):
+        if self.vl_action == "update":
+            return
+        if _raise := [
+            col for col in self.vl_cols_nullable if col not in columns
+        ]:
             raise NullableColumnError(
                 f"column which not null property, "
                 f"{str(_raise)}, does not exists in data"
             )
 
-    def validate_col_pk(self, columns: list):
+    def validate_col_pk(self, columns: Collection[str]):
         if self.vl_action != "insert" and any(
             _ not in columns for _ in self.vl_expected_pk
         ):
@@ -358,26 +379,23 @@ class Value:
 
     @staticmethod
     def validate_col_sql_inject(values: dict):
-        if any(
-            (
-                ("drop " in value)
-                or ("select " in value)
-                or ("delete " in value)
-                or ("insert " in value)
-            )
-            for value in values.values()
-            if value and isinstance(value, str)
-        ):
+        # NOTE: Join all string values with the null character that can not
+        #   be a part of keyword, so each keyword scans all values only once.
+        _text: str = "\x00".join(
+            [
+                value
+                for value in values.values()
+                if value and isinstance(value, str)
+            ]
+        )
+        if any(keyword in _text for keyword in SQL_INJECT_KEYWORDS):
             raise SQLInjection(
                 "data in payloads have sub SQL query like: "
                 "`select`, `drop`, `delete`, `insert`"
             )
 
-    def validate_col_outer(self, columns: list):
-        if any(col not in self.expected_cols for col in columns):
-            outer: list = list(
-                set(columns).difference(set(self.expected_cols.keys()))
-            )
+    def validate_col_outer(self, columns: Collection[str]):
+        if outer := [col for col in columns if col not in self.expected_cols]:
             raise OuterColumnError(
                 f"Data column, {outer}, was outer from configuration. "
                 f"Please check column name in payloads"
@@ -481,16 +499,18 @@ class Value:
             ]
         }
         """
-        _cols_expected: list = [
-            k for k, v in self.expected_cols.items() if v.default is None
-        ]
-        _cols: list = list(values)
-
         if isinstance(values, list):
             _values_list: list = []
             _col_previous: list = []
+            _col_validated: Optional[tuple] = None
             for index, data in enumerate(values, start=1):
-                _cols, _values = self._generate_common(values=data)
+                # NOTE: The schema validation depends on the columns only, so
+                #   it can skip if the columns equal to the validated row.
+                _col_data: tuple = tuple(data)
+                _cols, _values = self._generate_row(
+                    data, validate=(_col_data != _col_validated)
+                )
+                _col_validated: tuple = _col_data
                 if index > 1 and (
                     self.vl_action == "update"
                     and (
@@ -505,20 +525,33 @@ class Value:
                 _col_previous: list = _cols
                 _values_list.append(_values)
             return _cols, ", ".join(_values_list)
+        return self._generate_row(values)
 
-        # Check duplicated
-        self.validate_col_duplicate(_cols)
+    def _generate_row(
+        self,
+        values: dict,
+        validate: bool = True,
+    ) -> tuple:
+        """Generate columns and values string of one row with common mode. The
+        columns validation will skip if the validate flag be False, but the SQL
+        injection validation always run.
+        """
+        _cols: list = list(values)
 
         # Check `update_date` exists
         if "update_date" in self.expected_cols and "update_date" not in _cols:
             _cols.append("update_date")
             values["update_date"] = self.vl_update_date
 
-        # Check `not null` exists
-        self.validate_col_nullable(_cols)
+        if validate:
+            # Check duplicated
+            self.validate_col_duplicate(_cols)
 
-        # Check Primary Key exists for update
-        self.validate_col_pk(_cols)
+            # Check `not null` exists
+            self.validate_col_nullable(values.keys())
+
+            # Check Primary Key exists for update
+            self.validate_col_pk(values.keys())
 
         # Check SQL injection
         self.validate_col_sql_inject(values)
@@ -526,10 +559,10 @@ class Value:
         result_values: str = (
             self._generate_result_str(_cols, values)
             if self.vl_action == "update"
-            else self._generate_result_str(_cols_expected, values)
+            else self._generate_result_str(self.vl_cols_expected, values)
         )
         result_columns: list = (
-            _cols if self.vl_action == "update" else _cols_expected
+            _cols if self.vl_action == "update" else list(self.vl_cols_expected)
         )
         return result_columns, result_values
 
@@ -639,73 +672,102 @@ class Value:
             ]
         }
         """
-        _cols_expected: list = [
-            k for k, v in self.expected_cols.items() if v.default is None
-        ]
 
         def merge_with_key(
             _data: dict,
             _key: Optional[str] = "data_merge",
-        ) -> list[dict]:
-            if _key not in _data:
-                return [_data]
-            _parents: dict = {k: v for k, v in _data.items() if k != _key}
-            _children: list = (
-                _data_key
-                if isinstance((_data_key := _data[_key]), list)
-                else [_data_key]
-            )
-            return [
-                _parents | _merge
-                for _child in _children
-                for _merge in merge_with_key(_child)
-            ]
-
-        if isinstance(values, list):
-            data_values_list: list = []
-            for value in values:
-                _data_columns, _data_values = self._generate_merge(value)
-                data_values_list.append(_data_values)
-            return _cols_expected, ", ".join(data_values_list)
-
-        _data_values_list: list = []
-        for _data_insert in merge_with_key(values):
-            _columns: list = list(_data_insert)
-            # Check duplicated
-            self.validate_col_duplicate(_columns)
-
-            # Check outer column does not exist
-            self.validate_col_outer(_columns)
+        ) -> Iterator[dict]:
+            """Yield the merged rows of the parent and its children with
+            the depth-first order. The parent values keep in one context dict
+            that will restore by the marker on the stack after all children
+            were yielded, so it allocates a new dict only on the leaf row.
+            """
+            _context: dict = {}
+            _stack: list[Union[dict, tuple[list, dict]]] = [_data]
+            while _stack:
+                _child = _stack.pop()
+                if isinstance(_child, tuple):
+                    _added, _replaced = _child
+                    for k in _added:
+                        del _context[k]
+                    _context.update(_replaced)
+                    continue
+                if _key not in _child:
+                    yield {**_context, **_child}
+                    continue
+                _added: list = []
+                _replaced: dict = {}
+                for k, v in _child.items():
+                    if k == _key:
+                        continue
+                    if k in _context:
+                        _replaced[k] = _context[k]
+                    else:
+                        _added.append(k)
+                    _context[k] = v
+                _children: list = (
+                    _data_key
+                    if isinstance((_data_key := _child[_key]), list)
+                    else [_data_key]
+                )
+                _stack.append((_added, _replaced))
+                _stack.extend(reversed(_children))
+
+        def generate_rows(_values: dict) -> Iterator[str]:
+            for _data_insert in merge_with_key(_values):
+                _columns: list = list(_data_insert)
+                # Check duplicated
+                self.validate_col_duplicate(_columns)
+
+                # Check outer column does not exist
+                self.validate_col_outer(_data_insert.keys())
+
+                # Check `update_date` exists
+                if (
+                    "update_date" in self.expected_cols
+                    and "update_date" not in _columns
+                ):
+                    _columns.append("update_date")
+                    _data_insert["update_date"] = self.vl_update_date
 
-            # Check `update_date` exists
-            if (
-                "update_date" in self.expected_cols
-                and "update_date" not in _columns
-            ):
-                _columns.append("update_date")
-                _data_insert["update_date"] = self.vl_update_date
+                # Check `not null` exists
+                self.validate_col_nullable(_data_insert.keys())
 
-            # Check `not null` exists
-            self.validate_col_nullable(_columns)
+                # Check SQL injection
+                self.validate_col_sql_inject(_data_insert)
 
-            # Check SQL injection
-            self.validate_col_sql_inject(_data_insert)
+                # TODO: Add action_mode == `update` in this ingest mode
+                yield self._generate_result_str(
+                    self.vl_cols_expected, _data_insert
+                )
 
-            # TODO: Add action_mode == `update` in this ingest mode
-            _data_values_list.append(
-                self._generate_result_str(_cols_expected, _data_insert)
-            )
-        return _cols_expected, ", ".join(_data_values_list)
+        return list(self.vl_cols_expected), ", ".join(
+            [
+                _row
+                for _values in (
+                    values if isinstance(values, list) else [values]
+                )
+                for _row in generate_rows(_values)
+            ]
+        )
 
     def _generate_result_str(self, columns, values) -> str:
         if self.vl_action == "update":
             value: str = ", ".join(
-                f"'{_data}'" for _ in columns if (_data := values.get(_))
+                [
+                    f"'{str(_data).translate(QUOTE_TRANS)}'"
+                    for _ in columns
+                    if (_data := values.get(_))
+                ]
             )
         else:
             value: str = ", ".join(
                 [
-                    f"'{_data}'" if (_data := values.get(_)) else "null"
+                    (
+                        f"'{str(_data).translate(QUOTE_TRANS)}'"
+                        if (_data := values.get(_))
+                        else "null"
+                    )
                     for _ in columns
                 ]
             )
@@ -5,6 +5,7 @@
 # ------------------------------------------------------------------------------
 from __future__ import annotations
 
+import sys
 from dataclasses import (
     dataclass,
     field,
@@ -23,6 +24,10 @@ from .base import get_run_date
 
 UNDEFINED: str = "undefined"
 
+# NOTE: The result dataclasses will create with `__slots__` instead of instance
+#   `__dict__` if the Python version support the `slots` argument.
+SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 def reduce_text(text: str, newline: Optional[str] = None) -> str:
     """Reduce text before insert to Database."""
@@ -94,13 +99,13 @@ class TaskStatus(str, Enum):
     PROCESSING = "processing"
 
 
-@dataclass
+@dataclass(**SLOTS)
 class IngestionRow:
     success: int
     failed: int
 
 
-@dataclass
+@dataclass(**SLOTS)
 class BaseResult:
     status: Status
     _message: str
@@ -143,13 +148,13 @@ class BaseResult:
         )
 
 
-@dataclass
+@dataclass(**SLOTS)
 class CommonResult(BaseResult):
     status: Status = Status.SUCCESS
     _message: str = ""
 
 
-@dataclass
+@dataclass(**SLOTS)
 class AnalyticResult(BaseResult):
     status: Status = Status.SUCCESS
     _message: str = ""
@@ -157,14 +162,14 @@ class AnalyticResult(BaseResult):
     logging: str = ""
 
 
-@dataclass
+@dataclass(**SLOTS)
 class DependencyResult(BaseResult):
     status: Status = Status.SUCCESS
     _message: str = ""
     mapping: dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**SLOTS)
 class IngestionResult(BaseResult):
     status: Status = Status.SUCCESS
     _message: str = ""
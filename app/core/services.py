@@ -7,7 +7,7 @@ from __future__ import annotations
 
 import ast
 import builtins
-import inspect
+import functools
 import time
 from collections.abc import Iterator
 from datetime import date, datetime
@@ -23,11 +23,11 @@ from .__types import DictKeyStr
 from .base import (
     PARAMS,
     get_cal_date,
+    get_function_parameters,
     get_plural,
     get_process_date,
     get_run_date,
     registers,
-    sort_by_priority,
 )
 from .connections import (
     ParamType,
@@ -78,7 +78,10 @@ from .statements import (
     FunctionStatement,
     SchemaStatement,
     TableStatement,
-    reduce_in_value,
+    reduce_bind_in_value,
+    reduce_bind_value,
+    reduce_condition,
+    reduce_primary_key,
     reduce_stm,
     reduce_value,
     reduce_value_pairs,
@@ -110,6 +113,24 @@ from .validators import (
 env = Environs(env_name=".env")
 logger = logging.getLogger(__name__)
 
+# NOTE: Reduce the static statements from the parameters file only once when
+#   this module was imported.
+PS_STM: dict[str, str] = {
+    "push_del_with_condition": reduce_stm(
+        PARAMS.ps_stm.push_del_with_condition, add_row_number=False
+    ),
+    "push_del_with_date.master_rtt": reduce_stm(
+        PARAMS.ps_stm.push_del_with_date.master_rtt
+    ),
+    "push_del_with_date.not_master": reduce_stm(
+        PARAMS.ps_stm.push_del_with_date.not_master
+    ),
+    "pull_max_data_date": reduce_stm(PARAMS.ps_stm.pull_max_data_date),
+}
+
+# NOTE: Column properties that compare between the config and the table.
+DIFF_CHECKS: tuple[str, ...] = ("order", "datatype", "nullable")
+
 
 def null_or_str(value: str) -> Optional[str]:
     return None if value == "None" else value
@@ -195,18 +216,59 @@ class MapParameterService(MapParameter):
         params: list[str],
         additional: Optional[DictKeyStr] = None,
     ) -> DictKeyStr:
-        _full_params: DictKeyStr = (
-            self.fwk_params.dict(by_alias=False)
-            | self.ext_params
-            | (additional or {})
-            | {"update_date": get_run_date(fmt="%Y-%m-%d %H:%M:%S")}
-        )
-        try:
-            return {param: _full_params[param] for param in params}
-        except KeyError as k:
-            raise CatalogArgumentError(
-                f"Catalog does not map config parameter for {k!r}"
-            ) from k
+        """Filter parameters with the priority order of update date, additional,
+        external, and framework parameters. The framework parameters will
+        convert to dict only when some parameter does not found before.
+        """
+        _sources: tuple[DictKeyStr, ...] = (
+            {"update_date": get_run_date(fmt="%Y-%m-%d %H:%M:%S")},
+            (additional or {}),
+            self.ext_params,
+        )
+        _fwk_params: Optional[DictKeyStr] = None
+        results: DictKeyStr = {}
+        for param in params:
+            for source in _sources:
+                if param in source:
+                    results[param] = source[param]
+                    break
+            else:
+                if _fwk_params is None:
+                    _fwk_params = self.fwk_params.dict(by_alias=False)
+                try:
+                    results[param] = _fwk_params[param]
+                except KeyError as k:
+                    raise CatalogArgumentError(
+                        f"Catalog does not map config parameter for {k!r}"
+                    ) from k
+        return results
+
+
+@functools.lru_cache(maxsize=32)
+def check_schema_exists(name: str) -> bool:
+    """Return the exists flag of schema from target database. This result will
+    cache per process, so use `check_schema_exists.cache_clear()` for refresh.
+    """
+    return query_select_check(
+        SchemaStatement(name=name).statement_check(), parameters=True
+    )
+
+
+# NOTE: Time to live in seconds of the cached table names from the Control
+#   Data Pipeline table.
+TABLES_TTL: float = 2.0
+
+
+def pull_table_names(condition: Optional[str] = None) -> frozenset[str]:
+    """Return the set of table names from the Control Data Pipeline table. The
+    result will reuse for the same condition within `TABLES_TTL` seconds.
+    """
+    return _pull_table_names(condition, int(time.monotonic() // TABLES_TTL))
+
+
+@functools.lru_cache(maxsize=4)
+def _pull_table_names(condition: Optional[str], _ttl: int) -> frozenset[str]:
+    return frozenset(tbl["table_name"] for tbl in Control.tables(condition))
 
 
 class Schema(SchemaStatement):
@@ -216,16 +278,18 @@ class Schema(SchemaStatement):
 
     def exists(self) -> bool:
         """Push exists statement to target database."""
-        return query_select_check(self.statement_check(), parameters=True)
+        return check_schema_exists(self.name)
 
     def create(self) -> Schema:
         """Push create statement to target database."""
         query_execute(self.statement_create())
+        check_schema_exists.cache_clear()
         return self
 
     def drop(self, cascade: bool = False) -> Schema:
         """Push drop statement to target database."""
         query_execute(self.statement_drop(cascade=cascade))
+        check_schema_exists.cache_clear()
         return self
 
 
@@ -333,6 +397,9 @@ class ActionQuery(BaseAction):
 class BaseNode(MapParameterService, TableStatement):
     """Base Node Service Model."""
 
+    # NOTE: Cache of default values for the Control tables with its run date.
+    _ctr_defaults: Optional[tuple[str, dict[str, DictKeyStr]]] = None
+
     @classmethod
     def parse_task(
         cls,
@@ -369,12 +436,12 @@ class BaseNode(MapParameterService, TableStatement):
         self,
         force_drop: bool = False,
         cascade: bool = False,
+        verbose: bool = False,
     ) -> Self:
         """Execute create statement to target database."""
         statements: list[str] = [self.statement_create()]
         if force_drop:
-            rows: int = self.count()
-            log: str = f"with {rows} row{get_plural(rows)} " if rows > 0 else ""
+            log: str = self.log_rows(verbose=verbose)
             statements.insert(0, self.statement_drop(cascade=cascade))
             logger.info(
                 f"Drop table {self.name!r} {log}before create successful"
@@ -397,11 +464,10 @@ class BaseNode(MapParameterService, TableStatement):
         self,
         cascade: bool = False,
         execute: bool = True,
+        verbose: bool = False,
     ) -> Optional[str]:
-        rows: int = self.count()
         logger.warning(
-            f"Drop table {self.name!r} "
-            f"{f'with {rows} row{get_plural(rows)} ' if rows > 0 else ''}"
+            f"Drop table {self.name!r} {self.log_rows(verbose=verbose)}"
             f"successful"
         )
         if execute:
@@ -411,20 +477,50 @@ class BaseNode(MapParameterService, TableStatement):
 
     def drop_partition(self): ...
 
-    def make_log(self, values: Optional[dict] = None):
-        try:
-            return Control("ctr_data_logging").create(
-                values=(
-                    {
+    def ctr_defaults(self, name: str) -> DictKeyStr:
+        """Return the default values for create or update the Control table.
+        These values will build only once until the run date was changed.
+        """
+        _run_date: str = self.fwk_params.run_date_fmt()
+        if self._ctr_defaults is None or self._ctr_defaults[0] != _run_date:
+            self._ctr_defaults = (
+                _run_date,
+                {
+                    "make_log": {
                         "table_name": self.name,
-                        "data_date": f"{self.fwk_params.run_date:%Y-%m-%d}",
-                        "run_date": f"{self.fwk_params.run_date:%Y-%m-%d}",
+                        "data_date": _run_date,
+                        "run_date": _run_date,
                         "action_type": "common",
                         "row_record": 0,
                         "process_time": 0,
-                    }
-                    | (values or {})
-                )
+                    },
+                    "log": {
+                        "table_name": self.name,
+                        "run_date": _run_date,
+                        "action_type": "common",
+                    },
+                    "make_watermark": {
+                        "system_type": PARAMS.map_tbl_sys.get(
+                            self.prefix, UNDEFINED
+                        ),
+                        "table_name": self.name,
+                        "table_type": UNDEFINED,
+                        "data_date": _run_date,
+                        "run_date": _run_date,
+                        "run_type": self.run_type,
+                        "run_count_now": 0,
+                        "run_count_max": 0,
+                        "rtt_value": 0,
+                        "rtt_column": UNDEFINED,
+                    },
+                },
+            )
+        return self._ctr_defaults[1][name]
+
+    def make_log(self, values: Optional[dict] = None):
+        try:
+            return Control("ctr_data_logging").create(
+                values=self.ctr_defaults("make_log") | (values or {})
             )
         except DatabaseProcessError:
             logger.warning("Cannot create log to `ctr_data_logging` ...")
@@ -435,9 +531,7 @@ class BaseNode(MapParameterService, TableStatement):
             pm_filter={
                 "table_name": self.name,
                 "run_date": (
-                    self.fwk_params.run_date.strftime("%Y-%m-%d")
-                    if not all_flag
-                    else "*"
+                    self.fwk_params.run_date_fmt() if not all_flag else "*"
                 ),
                 "action_type": action_type,
             },
@@ -447,37 +541,20 @@ class BaseNode(MapParameterService, TableStatement):
     def log(self, values: Optional[dict] = None):
         try:
             return Control("ctr_data_logging").push(
-                values=(
-                    {
-                        "table_name": self.name,
-                        "run_date": f"{self.fwk_params.run_date:%Y-%m-%d}",
-                        "action_type": "common",
-                    }
-                    | (values or {})
-                )
+                values=self.ctr_defaults("log") | (values or {})
             )
         except DatabaseProcessError:
             logger.warning("Cannot update log to `ctr_data_logging` ...")
 
-    def make_watermark(self, values: Optional[dict] = None):
+    def make_watermark(
+        self,
+        values: Optional[dict] = None,
+        *,
+        returning: bool = False,
+    ):
         return Control("ctr_data_pipeline").create(
-            values=(
-                {
-                    "system_type": PARAMS.map_tbl_sys.get(
-                        self.prefix, UNDEFINED
-                    ),
-                    "table_name": self.name,
-                    "table_type": UNDEFINED,
-                    "data_date": f"{self.fwk_params.run_date:%Y-%m-%d}",
-                    "run_date": f"{self.fwk_params.run_date:%Y-%m-%d}",
-                    "run_type": self.run_type,
-                    "run_count_now": 0,
-                    "run_count_max": 0,
-                    "rtt_value": 0,
-                    "rtt_column": UNDEFINED,
-                }
-                | (values or {})
-            )
+            values=self.ctr_defaults("make_watermark") | (values or {}),
+            returning=returning,
         )
 
     def push(self, values: Optional[DictKeyStr] = None) -> int:
@@ -492,6 +569,23 @@ class BaseNode(MapParameterService, TableStatement):
             )
             return 0
 
+    def has_rows(self) -> bool:
+        """Return True if the table exists and has at least one row without
+        counting all rows of it.
+        """
+        return self.exists() and query_select_check(
+            self.statement_has_rows(), parameters=True
+        )
+
+    def log_rows(self, verbose: bool = False) -> str:
+        """Return the rows message for logging. The precise number of rows
+        will count only when verbose flag was set.
+        """
+        if verbose:
+            rows: int = self.count()
+            return f"with {rows} row{get_plural(rows)} " if rows > 0 else ""
+        return "with rows " if self.has_rows() else ""
+
     def count(self, condition: Optional[Union[str, list]] = None) -> int:
         if condition:
             _condition: list = (
@@ -505,12 +599,10 @@ class BaseNode(MapParameterService, TableStatement):
 
     def pull_metadata(self) -> dict[str, Any]:
         return {
-            rows["column_name"]: {
-                "order": int(rows["ordinal_position"]),
-                "datatype": rows["data_type"],
-                "nullable": eval(rows["nullable"]),
-            }
-            for rows in query_select(self.statement_columns(), parameters=True)
+            rows.pop("column_name"): rows
+            for rows in query_select(
+                self.statement_columns(), parameters=True, dtype=None
+            )
         }
 
 
@@ -523,12 +615,21 @@ class Node(BaseNode):
     )
 
     def __init__(self, **data):
+        # NOTE: The watermark field keeps its plain dict default until the
+        #   pulled watermark data fill it below.
+        watermark: DictKeyStr = data.pop("watermark", {})
         super().__init__(**data)
+        # NOTE: Run both statements one after the other, because each call
+        #   may start the SSH tunnel under `SSH_FLAG` that is not safe to
+        #   start from concurrent threads.
+        self.__dict__["watermark"] = ControlWatermark.parse_obj(
+            self.pull_watermark() | watermark
+        )
         # TODO: We should re-design this step
-        self.__validate_create()
+        self.__validate_create(exists=self.exists())
         self.__validate_quota()
 
-    def __validate_create(self) -> None:
+    def __validate_create(self, exists: bool) -> None:
         _auto_create: bool = self.validate_name_flag(
             self.fwk_params.task_params.others.get("auto_create", "N")
         )
@@ -540,7 +641,7 @@ class Node(BaseNode):
             self.fwk_params.task_params.others,
         )
         print("Validate Create auto_create: ", _auto_create)
-        if not self.exists():
+        if not exists:
             if not _auto_create:
                 raise TableNotFound(
                     "Please set `auto_create` be True or setup via API."
@@ -562,8 +663,14 @@ class Node(BaseNode):
                 f"Auto insert configuration data to `ctr_data_pipeline` "
                 f"for {self.name!r}"
             )
-            self.make_watermark()
-            self.watermark_refresh()
+            # NOTE: Use the returning row of the creation instead of pulling
+            #   it again, but fall back when the conflict filter skips it.
+            if _watermark := self.make_watermark(returning=True):
+                self.__dict__["watermark"] = ControlWatermark.parse_obj(
+                    _watermark
+                )
+            else:
+                self.watermark_refresh()
 
     def __validate_quota(self) -> None:
         if (
@@ -581,20 +688,22 @@ class Node(BaseNode):
 
     @property
     def split_choose(self) -> Choose:
-        _process: dict[str, list[str]] = {"reject": [], "filter": []}
+        if not self.choose:
+            return Choose(included=list(self.process.keys()), excluded=[])
+        _reject: list[str] = []
+        _filter: set[str] = set()
         for process in self.choose:
             if process.startswith("!"):
-                _process["reject"].append(process.split("!")[-1])
+                _reject.append(process[1:])
             else:
-                _process["filter"].append(process)
-        _filter: list[str] = _process["filter"]
+                _filter.add(process)
         return Choose(
             included=(
                 [_ for _ in self.process.keys() if _ in _filter]
                 if _filter
                 else list(self.process.keys())
             ),
-            excluded=_process["reject"],
+            excluded=_reject,
         )
 
     @property
@@ -604,20 +713,19 @@ class Node(BaseNode):
             or self.watermark.run_count_max == 0
         ) and (self.fwk_params.run_date == self.watermark.run_date)
 
-    @validator("watermark", pre=True, always=True)
-    def __prepare_watermark(cls, value: DictKeyStr, values):
-        try:
-            wtm: DictKeyStr = WTM_DEFAULT | Control("ctr_data_pipeline").pull(
-                pm_filter=[values["name"]]
-            )
-        except DatabaseProcessError:
-            wtm = WTM_DEFAULT
-        return ControlWatermark.parse_obj(wtm | value)
-
     @validator("choose", pre=True, always=True)
     def __prepare_choose(cls, value: Union[str, list[str]]) -> list[str]:
         return list(set(value)) if isinstance(value, list) else [value]
 
+    def pull_watermark(self) -> DictKeyStr:
+        """Pull watermark data of this node from the Control Pipeline."""
+        try:
+            return WTM_DEFAULT | Control("ctr_data_pipeline").pull(
+                pm_filter=[self.name]
+            )
+        except DatabaseProcessError:
+            return WTM_DEFAULT
+
     def watermark_refresh(self):
         logger.debug("Add more external parameters ...")
         self.__dict__["watermark"] = ControlWatermark.parse_obj(
@@ -634,9 +742,7 @@ class Node(BaseNode):
 
     def delete_with_condition(self, condition: str) -> int:
         return query_select_row(
-            reduce_stm(
-                PARAMS.ps_stm.push_del_with_condition, add_row_number=False
-            ),
+            PS_STM["push_del_with_condition"],
             parameters={"table_name": self.name, "condition": condition},
         )
 
@@ -645,26 +751,18 @@ class Node(BaseNode):
         del_date: str,
         del_mode: Optional[str] = None,
     ) -> int:
-        if len(self.watermark.rtt_column) > 1:
+        is_master: bool = self.watermark.table_type == "master"
+        if is_master and del_mode != "rtt":
+            return 0
+        elif len(self.watermark.rtt_column) > 1:
             raise CatalogArgumentError(
                 "Delete with date does not support for multi rtt columns."
             )
-        _primary_key: list[str] = self.profile.primary_key
-        _primary_key_group: str = ",".join(
-            [str(_) for _ in range(1, len(_primary_key) + 1)]
-        )
-        _primary_key_mark_a: str = ",".join(
-            [f"a.{col}" for col in _primary_key]
+        _stm: str = (
+            PS_STM["push_del_with_date.master_rtt"]
+            if is_master
+            else PS_STM["push_del_with_date.not_master"]
         )
-        _primary_key_join_a_and_b: str = "on " + " and ".join(
-            [f"a.{col} = b.{col}" for col in _primary_key]
-        )
-        if self.watermark.table_type == "master" and del_mode == "rtt":
-            _stm: str = reduce_stm(PARAMS.ps_stm.push_del_with_date.master_rtt)
-        elif self.watermark.table_type != "master":
-            _stm: str = reduce_stm(PARAMS.ps_stm.push_del_with_date.not_master)
-        else:
-            return 0
         return query_select_row(
             _stm,
             parameters={
@@ -673,11 +771,8 @@ class Node(BaseNode):
                 "del_operation": ("<" if del_mode == "rtt" else ">="),
                 "del_date": del_date,
                 "table_name": self.name,
-                "primary_key": ", ".join(_primary_key),
-                "primary_key_group": _primary_key_group,
-                "primary_key_mark_a": _primary_key_mark_a,
-                "primary_key_join_a_and_b": _primary_key_join_a_and_b,
-            },
+            }
+            | reduce_primary_key(tuple(self.profile.primary_key)),
         )
 
     def pull_max_data_date(self, default: bool = True) -> Optional[date]:
@@ -695,7 +790,7 @@ class Node(BaseNode):
             )
         return date.fromisoformat(
             query_select_one(
-                PARAMS.ps_stm.pull_max_data_date,
+                PS_STM["pull_max_data_date"],
                 parameters={
                     "table_name": self.name,
                     "ctr_rtt_col": self.watermark.rtt_column[0],
@@ -705,7 +800,7 @@ class Node(BaseNode):
 
     def init(self) -> Self:
         if init := self.initial:
-            _start_time: datetime = self.fwk_params.checkpoint()
+            _start_time: float = self.fwk_params.checkpoint()
             rows: int = self.__execute(init, force_sql=True)
             self.make_log(
                 values={
@@ -745,7 +840,7 @@ class Node(BaseNode):
 
         # Push table process with `func` type
         _func: callable = process.get("function")
-        _func_params: list = list(inspect.signature(_func).parameters.keys())
+        _func_params: tuple[str, ...] = get_function_parameters(_func)
 
         if not (
             _key := only_one(_func_params, PARAMS.map_func.input, default=False)
@@ -787,69 +882,91 @@ class Node(BaseNode):
     ) -> dict[int, int]:
         """Push all table processes to target database."""
         _rs: dict[int, int] = {1: 0}
-        _start_time: datetime = self.fwk_params.checkpoint()
-        _run_date: str = f"{self.fwk_params.run_date:%Y-%m-%d}"
-        self.make_log(
-            values={
-                "run_date": params.get("run_date", _run_date),
-                "data_date": params.get("data_date", _run_date),
-                "action_type": act_type,
-            }
-        )
+        _start_time: float = self.fwk_params.checkpoint()
+        _run_date: str = self.fwk_params.run_date_fmt()
+        _params: dict[str, Any] = params or {}
+        _dates: dict[str, str] = {
+            "run_date": _params.get("run_date", _run_date),
+            "data_date": _params.get("data_date", _run_date),
+        }
+        self.make_log(values=_dates | {"action_type": act_type})
         ext_filter_mock: bool = must_bool(
             self.ext_params.get("data_normal_common_filter_mockup", "N"),
             force_raise=True,
         )
+        _excluded: frozenset[str] = frozenset(excluded)
+        _included: frozenset[str] = frozenset(included)
+        # NOTE: Keep the logging values in memory and update it to the Control
+        #   Logging only once after all processes or when a process was failed.
+        _log_values: dict[str, Any] = {
+            "run_date": _dates["run_date"],
+            "action_type": act_type,
+        }
+        _log_pending: bool = False
+        _type: str = self.type.upper()
+        _execute: callable = self.__execute
+        _duration: callable = self.fwk_params.duration
+        _info: bool = logger.isEnabledFor(logging.INFO)
+
+        def log_success() -> None:
+            if _log_pending:
+                self.log(
+                    values=_log_values
+                    | {
+                        "row_record": reduce_text(str(_rs)),
+                        "status": Status.SUCCESS.value,
+                    }
+                )
+
         for index, (name, ps) in enumerate(self.process.items(), start=1):
             if (
                 (name.lower().startswith("mockup_data") and ext_filter_mock)
-                or name in excluded
-                or name not in included
+                or name in _excluded
+                or name not in _included
             ):
-                logger.warning(f"Filter {self.type.upper()} process: {name!r}")
+                logger.warning(f"Filter {_type} process: {name!r}")
                 _rs[index] = 0
                 continue
-            logger.info(
-                f"Priority {index:02d}: {self.type.upper()} process: {name!r}"
-            )
+            logger.info("Priority %02d: %s process: %r", index, _type, name)
             try:
-                _rs[index] = self.__execute(ps.dict(), additional=params)
-                logger.info(
-                    f"Success with running process with {_rs[index]} "
-                    f"row{get_plural(_rs[index])}"
-                )
-                self.log(
-                    values={
-                        "run_date": params.get("run_date", _run_date),
-                        "action_type": act_type,
-                        "row_record": reduce_text(str(_rs)),
-                        "process_time": self.fwk_params.duration(_start_time),
-                        "status": Status.SUCCESS.value,
-                    }
-                )
+                _rs[index] = _execute(ps.dict(), additional=_params)
+                if _info:
+                    logger.info(
+                        "Success with running process with %s row%s",
+                        _rs[index],
+                        get_plural(_rs[index]),
+                    )
+                _log_values["process_time"] = _duration(_start_time)
+                _log_pending = True
             except DatabaseProcessError as err:
                 _rs[index] = 0
                 self.log(
-                    values={
-                        "run_date": params.get("run_date", _run_date),
-                        "action_type": act_type,
+                    values=_log_values
+                    | {
                         "row_record": reduce_text(str(_rs)),
-                        "process_time": self.fwk_params.duration(_start_time),
+                        "process_time": _duration(_start_time),
                         "status": Status.FAILED.value,
                     }
                 )
                 if raise_if_error:
                     raise err
                 logger.error(f"Error: {err.__class__.__name__}: {str(err)}")
-                break
+                return _rs
+            except Exception:
+                # NOTE: Persist the progress of processes that already
+                #   finished before raise any other error.
+                log_success()
+                raise
+        log_success()
         return _rs
 
     def __validate_func_output_type(self, value: Any) -> str:
-        import pandas as pd
-
         if isinstance(value, str):
             return value
-        elif isinstance(value, pd.DataFrame):
+
+        import pandas as pd
+
+        if isinstance(value, pd.DataFrame):
             raise TableNotImplement(
                 f"Output of process function in {self.name!r} "
                 f"does not support for DataFrame type yet."
@@ -906,12 +1023,12 @@ class Node(BaseNode):
         )
 
     def process_count(self) -> int:
-        _excluded: list = self.split_choose.excluded
-        if _included := self.split_choose.included:
+        _choose: Choose = self.split_choose
+        if _included := _choose.included:
             return len(_included) - len(
-                set(_included).intersection(set(_excluded))
+                set(_included).intersection(_choose.excluded)
             )
-        return self.process_max - len(_excluded)
+        return self.process_max - len(_choose.excluded)
 
     def process_start(self) -> dict[int, int]:
         _additional: dict[str, Any] = self.ext_params.copy()
@@ -928,9 +1045,10 @@ class Node(BaseNode):
                 PARAMS.map_tbl_ps_sla[self.watermark.run_type], 1
             )
         _run_date, _data_date = self._prepare_before_rerun(sla=_ps_sla)
+        _choose: Choose = self.split_choose
         _row_record: dict[int, int] = self.execute(
-            included=self.split_choose.included,
-            excluded=self.split_choose.excluded,
+            included=_choose.included,
+            excluded=_choose.excluded,
             act_type=self.fwk_params.run_mode,
             params=(
                 _additional
@@ -944,7 +1062,7 @@ class Node(BaseNode):
             self.push(
                 values={
                     "data_date": f"{self.pull_max_data_date():%Y-%m-%d}",
-                    "run_date": f"{self.fwk_params.run_date:%Y-%m-%d}",
+                    "run_date": self.fwk_params.run_date_fmt(),
                     "run_count_now": self.process_run_count(
                         row_record=_row_record
                     ),
@@ -976,7 +1094,7 @@ class NodeManage(Node):
         backup_schema: Optional[str] = None,
         raise_if_error: bool = True,
     ) -> int:
-        _start_time: datetime = self.fwk_params.checkpoint()
+        _start_time: float = self.fwk_params.checkpoint()
         self.make_log(values={"action_type": "backup"})
         _stm_all: list = [
             self.statement_backup(name=backup_name),
@@ -1023,7 +1141,7 @@ class NodeManage(Node):
 
     def backup(self) -> int:
         backup_name, backup_schema = self.name_backup
-        if any(backup_name == x["table_name"] for x in Control.tables()):
+        if backup_name in pull_table_names():
             raise TableNotImplement(
                 f"default backup table name {backup_name!r} was "
                 f"duplicated with any table in catalog"
@@ -1057,7 +1175,7 @@ class NodeManage(Node):
         )
 
     def __retention(self, rtt_date: date):
-        _start_time: datetime = self.fwk_params.checkpoint()
+        _start_time: float = self.fwk_params.checkpoint()
         self.make_log(
             values={
                 "data_date": rtt_date.strftime("%Y-%m-%d"),
@@ -1143,7 +1261,7 @@ class NodeManage(Node):
         logger.info(
             f"Update column properties or add new column"
             f"{get_plural(len(not_exists_cols))}, "
-            f"{', '.join([repr(_) for _ in not_exists_cols])} of table "
+            f"{', '.join(map(repr, not_exists_cols))} of table "
             f"{self.name!r} in database"
         )
         add_col_list = [
@@ -1167,7 +1285,7 @@ class NodeManage(Node):
         data."""
         logger.info(
             f"Drop column{get_plural(len(exists_cols))}, "
-            f"{', '.join([repr(_) for _ in exists_cols])} of table "
+            f"{', '.join(map(repr, exists_cols))} of table "
             f"{self.name!r} in database"
         )
         print(", ".join(f"drop column {col}" for col in exists_cols))
@@ -1179,45 +1297,42 @@ class NodeManage(Node):
     def __diff_merge(self, merge_cols: dict):
         """Transfer full data from old table to new created table from merge
         columns."""
-        mapping_col_insert: list = []
-        mapping_col_select: list = []
+        mapping_col_select: list[str] = []
         for col_name, col_attrs in merge_cols.items():
-            mapping_col_insert.append(col_name)
-            if _not_match := col_attrs["not_match"]:
-                stm_select: str = col_name
-
-                # Check nullable not match
-                if _nullable := _not_match.get("nullable"):
-                    # Generate default value with data-type
-                    if not _nullable[0] and _nullable[1]:
-                        # stm_select: str = f"coalesce({col_name}, {default})"
-                        raise TableNotImplement(
-                            f"Table column different merge process does not "
-                            f"support for change `null` to `not null` "
-                            f"with column: {col_name!r} in {self.name!r}"
-                        )
+            if not (_not_match := col_attrs["not_match"]):
+                mapping_col_select.append(col_name)
+                continue
 
-                # Check data-type not match
-                if _datatype := _not_match.get("datatype"):
-                    stm_select: str = (
-                        f"{stm_select}::{_datatype[0]} as {col_name}"
-                    )
+            # Check nullable not match
+            _nullable: Optional[list] = _not_match.get("nullable")
+            if _nullable and not _nullable[0] and _nullable[1]:
+                # stm_select: str = f"coalesce({col_name}, {default})"
+                raise TableNotImplement(
+                    f"Table column different merge process does not "
+                    f"support for change `null` to `not null` "
+                    f"with column: {col_name!r} in {self.name!r}"
+                )
 
-                mapping_col_select.append(stm_select)
-                continue
-            mapping_col_select.append(col_name)
+            # Check data-type not match
+            _datatype: Optional[list] = _not_match.get("datatype")
+            mapping_col_select.append(
+                f"{col_name}::{_datatype[0]} as {col_name}"
+                if _datatype
+                else col_name
+            )
 
-        logger.info(
-            f"insert into {{database_name}}.{{ai_schema_name}}.{self.name} "
-            f"\n\t\t ( {', '.join(mapping_col_insert)} ) \n"
-            f"\t\t select {', '.join(mapping_col_select)} \n"
-            f"\t\t from {{database_name}}.{{ai_schema_name}}."
-            f"{self.name}_old;"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"insert into {{database_name}}.{{ai_schema_name}}.{self.name} "
+                f"\n\t\t ( {', '.join(merge_cols)} ) \n"
+                f"\t\t select {', '.join(mapping_col_select)} \n"
+                f"\t\t from {{database_name}}.{{ai_schema_name}}."
+                f"{self.name}_old;"
+            )
         # NOTE:
         # query_execute(statement=params.ps_stm.push_merge, parameters={
         #     'table_name': self.tbl_name,
-        #     'mapping_insert': ', '.join(mapping_col_insert),
+        #     'mapping_insert': ', '.join(merge_cols),
         #     'mapping_select': ', '.join(mapping_col_select)
         # })
 
@@ -1235,20 +1350,14 @@ class NodeManage(Node):
         _pull_cols: dict = self.pull_metadata()
         _get_cols: dict[str, ColumnStatement] = self.profile.to_mapping(pk=True)
 
-        compare_diff: dict = {"left": set(), "right": set(), "all": set()}
-        compare_diff["left"].update(
-            set(_get_cols.keys()).difference(set(_pull_cols.keys()))
-        )
-        compare_diff["right"].update(
-            set(_pull_cols.keys()).difference(set(_get_cols.keys()))
-        )
-        compare_diff["all"].update(
-            set(_get_cols.keys()).intersection(set(_pull_cols.keys()))
-        )
+        _get_keys, _pull_keys = _get_cols.keys(), _pull_cols.keys()
+        compare_diff: dict[str, set[str]] = {
+            "left": _get_keys - _pull_keys,
+            "right": _pull_keys - _get_keys,
+            "all": _get_keys & _pull_keys,
+        }
 
-        if len(_get_cols) != len(_pull_cols) or sorted(
-            _get_cols.keys()
-        ) != sorted(_pull_cols.keys()):
+        if _get_keys != _pull_keys:
             context["col_not_equal"] = True
             if not compare_diff["right"]:
                 context["col_update"] = True
@@ -1273,8 +1382,9 @@ class NodeManage(Node):
 
         for col_name, col_attrs in _get_cols.items():
             result: dict = {"match": {}, "not_match": {}}
-            for _check in {"order", "datatype", "nullable"}:
-                if _pull_cols[col_name][_check] != col_attrs[_check]:
+            _pull_attrs: dict = _pull_cols[col_name]
+            for _check in DIFF_CHECKS:
+                if _pull_attrs[_check] != col_attrs[_check]:
                     context["col_diff"] = True
                     if _check == "order":
                         # Cannot use update or delete because order of column
@@ -1283,14 +1393,14 @@ class NodeManage(Node):
                         context["col_delete"] = False
                     result["not_match"][_check] = (
                         col_attrs[_check],
-                        _pull_cols[col_name][_check],
+                        _pull_attrs[_check],
                     )
                 else:
                     result["match"][_check] = (
                         col_attrs[_check],
-                        _pull_cols[col_name][_check],
+                        _pull_attrs[_check],
                     )
-                results[col_name]: dict = result
+            results[col_name] = result
         return results, context
 
 
@@ -1300,7 +1410,6 @@ class NodeLocal(Node):
     def load(
         self,
         filename: str,
-        chuck: int = 10_000,
         truncate: bool = False,
         compress: Optional[str] = None,
     ) -> int:
@@ -1313,18 +1422,14 @@ class NodeLocal(Node):
                 "engine": "python",
             },
         }
-        rows: int = 0
-        for chunk, row in query_insert_from_csv(
+        rows: int = query_insert_from_csv(
             file_props,
-            chunk_size=chuck,
             truncate=truncate,
             compress=compress,
-        ):
-            logger.info(
-                f"Success with first chuck size {chunk} "
-                f"with {row} row{get_plural(row)}"
-            )
-            rows += row
+        )
+        logger.info(
+            f"Success load file {filename!r} with {rows} row{get_plural(rows)}"
+        )
         return rows
 
 
@@ -1341,7 +1446,7 @@ class NodeIngest(Node):
     ) -> tuple[int, int]:
         ps_row_success: int = 0
         ps_row_failed: int = 0
-        _start_time: datetime = self.fwk_params.checkpoint()
+        _start_time: float = self.fwk_params.checkpoint()
         self.make_log(
             values={
                 "data_date": update_date.strftime("%Y-%m-%d"),
@@ -1478,12 +1583,20 @@ class BasePipeline(MapParameterService, PipelineCatalog):
     @classmethod
     def pull_watermarks(
         cls,
-        pipe_id: Optional[str] = None,
+        pipe_id: Optional[Union[str, list[str]]] = None,
         included_cols: Optional[list] = None,
         all_flag: bool = False,
     ):
-        """Pull tacking data from the Control Task Schedule."""
-        if pipe_id:
+        """Pull tacking data from the Control Task Schedule. The list of
+        pipeline ids will pull only those pipelines in one query.
+        """
+        if isinstance(pipe_id, list):
+            return Control("ctr_task_schedule").pull(
+                pm_filter=pipe_id,
+                included=included_cols,
+                all_flag=True,
+            )
+        elif pipe_id:
             _pipe_id: str = pipe_id
         elif all_flag:
             _pipe_id: str = "*"
@@ -1499,24 +1612,24 @@ class BasePipeline(MapParameterService, PipelineCatalog):
 
     def make_watermark(self, values: Optional[dict] = None):
         return Control("ctr_task_schedule").create(
-            values=(
-                {
-                    "pipeline_id": self.id,
-                    "pipeline_name": self.name,
-                    "pipeline_type": self.schedule,
-                    "tracking": "SUCCESS",
-                    "active_flg": "true",
-                }
-                | (values or {})
-            )
+            values={
+                "pipeline_id": self.id,
+                "pipeline_name": self.name,
+                "pipeline_type": self.schedule,
+                "tracking": "SUCCESS",
+                "active_flg": "true",
+                **(values or {}),
+            }
         )
 
     def push(self, values: Optional[dict] = None):
         """Update tacking information to the Control Task Schedule."""
         return Control("ctr_task_schedule").push(
-            values=(
-                {"pipeline_id": self.id, "tracking": "SUCCESS"} | (values or {})
-            )
+            values={
+                "pipeline_id": self.id,
+                "tracking": "SUCCESS",
+                **(values or {}),
+            }
         )
 
 
@@ -1545,12 +1658,10 @@ class Pipeline(BasePipeline):
     @validator("watermark", pre=True, always=True)
     def __prepare_watermark(cls, value: DictKeyStr, values):
         try:
-            wtm: DictKeyStr = SCH_DEFAULT | cls.pull_watermarks(
-                pipe_id=values["name"]
-            )
+            wtm: DictKeyStr = cls.pull_watermarks(pipe_id=values["name"])
         except DatabaseProcessError:
-            wtm = SCH_DEFAULT
-        return ControlSchedule.parse_obj(wtm | value)
+            wtm = {}
+        return ControlSchedule.parse_obj({**SCH_DEFAULT, **wtm, **value})
 
     def watermark_refresh(self):
         logger.debug("Add more external parameters ...")
@@ -1565,17 +1676,18 @@ class Pipeline(BasePipeline):
     ) -> Iterator[tuple[int, NodeManage]]:
         """Node method for passing pipeline parameters to all node in the
         pipeline."""
+        _fwk_params: DictKeyStr = {
+            "run_id": self.fwk_params.run_id,
+            "run_date": self.fwk_params.run_date_fmt(),
+            "run_mode": self.fwk_params.run_mode,
+            "task_params": self.fwk_params.task_params,
+        }
         for order, node in self.nodes.items():
             yield (
                 order,
                 NodeManage.parse_task(
                     name=node["name"],
-                    fwk_params={
-                        "run_id": self.fwk_params.run_id,
-                        "run_date": f"{self.fwk_params.run_date:%Y-%m-%d}",
-                        "run_mode": self.fwk_params.run_mode,
-                        "task_params": self.fwk_params.task_params,
-                    },
+                    fwk_params=_fwk_params,
                     ext_params=self.ext_params,
                 ).filter(node.get("choose", [])),
             )
@@ -1624,9 +1736,20 @@ class PipelineManage(Pipeline):
             )
         return False
 
+    @classmethod
+    def __trigger_ids(cls, trigger: Union[str, list, set]) -> Iterator[str]:
+        """Generate all pipeline ids that nested in the trigger value."""
+        if isinstance(trigger, str):
+            yield trigger
+            return
+        for _trigger in trigger:
+            yield from cls.__trigger_ids(_trigger)
+
     def check_triggered(self) -> bool:
         """Return True if pipeline ..."""
-        _triggers: Union[set, list] = self.trigger.copy()
+        _triggers: Union[set, list] = self.trigger
+        if not (_trigger_ids := sorted(set(self.__trigger_ids(_triggers)))):
+            return False
         _all_pipe_schedules: dict = {
             _ctr_value["pipeline_id"]: {
                 "tracking": _ctr_value["tracking"],
@@ -1635,8 +1758,8 @@ class PipelineManage(Pipeline):
                 ),
             }
             for _ctr_value in self.pull_watermarks(
+                pipe_id=_trigger_ids,
                 included_cols=["pipeline_id", "tracking", "update_date"],
-                all_flag=True,
             )
         }
         return self.__check_trigger_function(_triggers, _all_pipe_schedules)
@@ -1806,6 +1929,20 @@ class Control(ControlStatement):
     def __str__(self) -> str:
         return self.name
 
+    @functools.cached_property
+    def defaults_create(self) -> DictKeyStr:
+        """Default values of columns that will use in the create method."""
+        return self.defaults | {"tracking": "SUCCESS", "active_flg": "Y"}
+
+    @functools.cached_property
+    def defaults_push(self) -> DictKeyStr:
+        """Default values of columns that will use in the push method."""
+        return {
+            col: default
+            for col, default in self.defaults.items()
+            if col in self.cols
+        }
+
     @classmethod
     def params(cls, module: Optional[str] = None) -> DictKeyStr:
         logger.debug("Loading params from `ctr_data_parameter` by Control ...")
@@ -1854,64 +1991,37 @@ class Control(ControlStatement):
         """Get all tables with `condition` argument from `ctr_data_pipeline` in
         target database and convert to python list of dictionary type."""
         logger.debug("Loading tables from `ctr_data_pipeline` by Control ...")
-        for name in sort_by_priority(
-            [
-                tbl["table_name"]
-                for tbl in cls("ctr_data_pipeline").pull(
-                    pm_filter={"table_name": "*"},
-                    included=["table_name"],
-                    condition=condition,
-                    all_flag=True,
-                )
-            ]
+        for tbl in cls("ctr_data_pipeline").pull(
+            pm_filter={"table_name": "*"},
+            included=["table_name"],
+            condition=condition,
+            order_by=cls.statement_order_priority(PARAMS.list_tbl_priority),
+            all_flag=True,
         ):
-            yield {"table_name": name}
+            yield {"table_name": tbl["table_name"]}
 
     def create(
         self,
         values: dict,
         condition: Optional[str] = None,
-    ) -> int:
-        _ctr_columns = filter(
-            lambda _col: _col not in {"primary_id"}, self.cols
-        )
-        _add_column: DictKeyStr = self.defaults | {
-            "tracking": "SUCCESS",
-            "active_flg": "Y",
-        }
-        _row_record_filter: str = ""
-        _status_filter: str = ""
-        for col in _ctr_columns:
-            value_old: Union[str, int] = (
-                _add_column.get(col, "null")
-                if col not in values
-                else values[col]
-            )
-            values[col]: str = reduce_value(value_old)
-        if "status" in list(_ctr_columns):
-            _status_filter: str = "where excluded.status = '2'"
-        if "row_record" in list(_ctr_columns):
-            _row_record_filter: str = (
-                f"{'or' if _status_filter else 'where'} "
-                f"{self.tbl.shortname}.row_record <= excluded.row_record"
-            )
-        _set_value_pairs: str = ", ".join(
-            [f"{_} = excluded.{_}" for _ in self.cols_no_pk]
-        )
-        return query_select_row(
-            self.statement_create(),
+        *,
+        returning: bool = False,
+    ) -> Union[int, DictKeyStr]:
+        """Create data to the control table. The returning flag will return
+        the created row instead of the number of rows in the same round-trip.
+        """
+        return (query_select_one if returning else query_select_row)(
+            self.statement_create(returning=returning),
             parameters={
-                "columns_pair": ", ".join(values),
-                "values": ", ".join(values.values()),
-                "primary_key": ", ".join(self.pk),
-                "set_value_pairs": _set_value_pairs,
-                "row_record_filter": _row_record_filter,
-                "status_filter": _status_filter,
-                "condition": (
-                    f"""AND ({condition.replace('"', "'")})"""
-                    if condition
-                    else ""
-                ),
+                "condition": reduce_condition(condition),
+            },
+            bind_values={
+                col: reduce_bind_value(
+                    values[col]
+                    if col in values
+                    else self.defaults_create.get(col)
+                )
+                for col in self.cols_create
             },
         )
 
@@ -1920,32 +2030,24 @@ class Control(ControlStatement):
         values: DictKeyStr,
         condition: Optional[str] = None,
     ) -> int:
-        _add_column: dict = self.defaults | {"tacking": "PROCESSING"}
-        for col, default in _add_column.items():
-            if col in self.cols and col not in values:
-                values[col] = default
-        _update_values: dict[str, str] = {
-            k: reduce_value(str(v))
-            for k, v in values.items()
+        _values: DictKeyStr = self.defaults_push | values
+        _update_values: dict[str, Optional[str]] = {
+            k: reduce_bind_value(v)
+            for k, v in _values.items()
             if k not in self.pk
         }
-        _filter: list[str] = [
-            f"{self.tbl.shortname}.{_} in {reduce_in_value(values[_])}"
-            for _ in self.pk
-        ]
         return query_select_row(
             self.statement_push(),
             parameters={
                 "update_values_pairs": ", ".join(
-                    [f"{k} = {v}" for k, v in _update_values.items()]
-                ),
-                "filter": " AND ".join(_filter),
-                "condition": (
-                    f"""AND ({condition.replace('"', "'")})"""
-                    if condition
-                    else ""
+                    [f"{k} = :{k}" for k in _update_values]
                 ),
+                "condition": reduce_condition(condition),
             },
+            bind_values=(
+                _update_values
+                | {pk: reduce_bind_in_value(_values[pk]) for pk in self.pk}
+            ),
         )
 
     def pull(
@@ -1953,6 +2055,7 @@ class Control(ControlStatement):
         pm_filter: Union[list, dict],
         condition: Optional[str] = None,
         included: Optional[list] = None,
+        order_by: Optional[str] = None,
         *,
         active_flag: Optional[str] = None,
         all_flag: Optional[bool] = False,
@@ -1989,11 +2092,8 @@ class Control(ControlStatement):
                     if "active_flg" in self.cols
                     else ""
                 ),
-                "condition": (
-                    f"""AND ({condition.replace('"', "'")})"""
-                    if condition
-                    else ""
-                ),
+                "condition": reduce_condition(condition),
+                "order_by": (order_by or ""),
             },
         )
 
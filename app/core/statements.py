@@ -6,6 +6,7 @@
 from __future__ import annotations
 
 import re
+from functools import cached_property, lru_cache
 from typing import (
     Optional,
     Union,
@@ -26,7 +27,7 @@ from .validators import (
 
 def reduce_value(value: Union[str, int]) -> str:
     if isinstance(value, list):
-        return f"({', '.join([reduce_value(_) for _ in value])})"
+        return f"({', '.join(map(reduce_value, value))})"
     elif value is None:
         return "null"
     return value if value in ("null", "true", "false", "*") else f"'{value}'"
@@ -41,12 +42,45 @@ def reduce_value_pairs(value_pairs: dict) -> dict:
 
 def reduce_in_value(value: Union[str, int, list]) -> str:
     if isinstance(value, list):
-        return f"({', '.join([reduce_value(_) for _ in value])})"
+        return f"({', '.join(map(reduce_value, value))})"
     return f"({reduce_value(value)})"
 
 
+def reduce_bind_value(value: Union[str, int, None]) -> Optional[str]:
+    """Reduce value to the bind parameter that pass to the database driver."""
+    return None if (value is None or value == "null") else str(value)
+
+
+def reduce_bind_in_value(value: Union[str, int, list]) -> tuple:
+    """Reduce value to the tuple bind parameter for the `IN` operator."""
+    return tuple(
+        map(reduce_bind_value, (value if isinstance(value, list) else [value]))
+    )
+
+
+@lru_cache(maxsize=256)
+def reduce_condition(condition: Optional[str] = None) -> str:
+    """Reduce condition to the `AND` statement with single quote values."""
+    return f"""AND ({condition.replace('"', "'")})""" if condition else ""
+
+
+@lru_cache(maxsize=128)
+def reduce_primary_key(primary_key: tuple[str, ...]) -> dict[str, str]:
+    """Reduce primary key columns to the mapping of statement fragments that
+    use to join or group by the primary key.
+    """
+    return {
+        "primary_key": ", ".join(primary_key),
+        "primary_key_group": ",".join(map(str, range(1, len(primary_key) + 1))),
+        "primary_key_mark_a": ",".join(f"a.{col}" for col in primary_key),
+        "primary_key_join_a_and_b": (
+            "on " + " and ".join(f"a.{col} = b.{col}" for col in primary_key)
+        ),
+    }
+
+
 def filter_not_null(datatype: str) -> bool:
-    return all(not re.search(word, datatype) for word in ["default", "serial"])
+    return "default" not in datatype and "serial" not in datatype
 
 
 class ColumnStatement(Column):
@@ -315,6 +349,22 @@ class TableStatement(Table):
             f"'{{ai_schema_name}}', '{self.name}') AS row_number"
         )
 
+    def statement_has_rows(self) -> str:
+        """Generate check statement that stop scanning at the first row.
+
+        :statement:
+
+            SELECT CASE WHEN EXISTS(
+                SELECT 1 FROM DATABASE.SCHEMA.TABLE_NAME LIMIT 1
+            ) THEN 'True' ELSE 'False' END AS check_exists
+        """
+        return reduce_stm(
+            f"SELECT CASE WHEN EXISTS("
+            f"SELECT 1 FROM {{database_name}}.{{ai_schema_name}}.{self.name} "
+            f"LIMIT 1"
+            f") THEN 'True' ELSE 'False' END AS check_exists"
+        )
+
     def statement_count_condition(self) -> str:
         return reduce_stm(
             f"SELECT COUNT(1) AS row_number "
@@ -348,8 +398,8 @@ class TableStatement(Table):
 
     def statement_columns(self):
         return reduce_stm(
-            f"SELECT ordinal_position "
-            f", column_name "
+            f"SELECT column_name "
+            f', ordinal_position::int AS "order" '
             f", CASE WHEN data_type = 'character varying' "
             f"       THEN concat('varchar( ', character_maximum_length, ' )') "
             f"       WHEN data_type = 'numeric' "
@@ -359,11 +409,9 @@ class TableStatement(Table):
             f"       WHEN data_type = 'timestamp without time zone' "
             f"       THEN 'timestamp' "
             f"       ELSE data_type "
-            f"  END AS data_type "
-            f", CASE WHEN column_default is not null then 'False' "
-            f"       WHEN lower(is_nullable) = 'no' then 'False' "
-            f"       ELSE 'True' "
-            f"  END AS nullable "
+            f"  END AS datatype "
+            f", ( column_default is null "
+            f"    AND lower(is_nullable) = 'yes' )::bool AS nullable "
             f"FROM  {{database_name}}.information_schema.columns "
             f"WHERE table_schema = '{{ai_schema_name}}' "
             f"AND   table_name   = '{self.name}' "
@@ -465,11 +513,30 @@ class SchemaStatement(Schema):
 class ControlStatement:
 
     def __init__(self, name: str) -> None:
-        self.tbl: Table = Table.parse_name(name=name)
+        self.tbl: Table = self.load_table(name)
         self.name: str = self.tbl.name
-        self.cols: list[str] = self.tbl.profile.columns(pk_included=True)
-        self.cols_no_pk: list[str] = self.tbl.profile.columns(pk_included=False)
-        self.pk: list[str] = self.tbl.profile.primary_key
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def load_table(name: str) -> Table:
+        """Load the catalog of control table that will cache per process."""
+        return Table.parse_name(name=name)
+
+    @cached_property
+    def cols(self) -> list[str]:
+        return self.tbl.profile.columns(pk_included=True)
+
+    @cached_property
+    def cols_no_pk(self) -> list[str]:
+        return self.tbl.profile.columns(pk_included=False)
+
+    @cached_property
+    def pk(self) -> list[str]:
+        return self.tbl.profile.primary_key
+
+    @cached_property
+    def cols_create(self) -> list[str]:
+        return [col for col in self.cols if col != "primary_id"]
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self.name})"
@@ -502,23 +569,84 @@ class ControlStatement:
         return reduce_stm(
             f"SELECT {{select_columns}} "
             f"FROM {{database_name}}.{{ai_schema_name}}.{self.name} "
-            f"WHERE {{primary_key_filters}} {{active_flag}} {{condition}}"
+            f"WHERE {{primary_key_filters}} {{active_flag}} {{condition}} "
+            f"{{order_by}}"
         )
 
-    def statement_create(self) -> str:
+    @staticmethod
+    def statement_order_priority(
+        priority_lists: list[str],
+        column: str = "table_name",
+    ) -> str:
+        """Generate order by statement that sort column by string prefix
+        priority.
+
+        :statement:
+
+            ORDER BY CASE
+                WHEN LEFT(COLUMN, LENGTH('PREFIX01')) = 'PREFIX01' THEN 0
+                ...
+                ELSE N
+            END, COLUMN
+        """
+        _cases: str = " ".join(
+            f"WHEN LEFT({column}, {len(prefix)}) = '{prefix}' THEN {order}"
+            for order, prefix in enumerate(priority_lists)
+        )
+        return (
+            f"ORDER BY CASE {_cases} ELSE {len(priority_lists)} END, {column}"
+            if priority_lists
+            else f"ORDER BY {column}"
+        )
+
+    def statement_create(self, returning: bool = False) -> str:
+        """Generate insert statement that bind values with column names. The
+        returning flag will return the inserted or updated row back.
+
+        :statement:
+
+            INSERT INTO DATABASE.SCHEMA.TABLE_NAME AS TN
+            ( COLUMN1, COLUMN2, ... ) VALUES ( :COLUMN1, :COLUMN2, ... )
+            ON CONFLICT ( PRIMARY KEY ) DO UPDATE
+                SET COLUMN2 = EXCLUDED.COLUMN2, ...
+            WHERE TRUE {condition}
+            [ RETURNING COLUMN1, COLUMN2, ... ]
+        """
+        _values: str = ", ".join(f":{col}" for col in self.cols_create)
+        _set_value_pairs: str = ", ".join(
+            f"{col} = excluded.{col}"
+            for col in self.cols_no_pk
+            if col in self.cols_create
+        )
         return reduce_stm(
             f"INSERT INTO {{database_name}}.{{ai_schema_name}}.{self.name} "
-            f"AS {self.tbl.shortname} ( {{columns_pair}} ) "
-            f"VALUES (  {{values}}  ) "
-            f"on conflict ( {{primary_key}} ) do update "
-            f"set {{set_value_pairs}} "
-            f"{{status_filter}} {{row_record_filter}} {{condition}}"
+            f"AS {self.tbl.shortname} ( {', '.join(self.cols_create)} ) "
+            f"VALUES ( {_values} ) "
+            f"on conflict ( {', '.join(self.pk)} ) do update "
+            f"set {_set_value_pairs} "
+            # NOTE: The conflict row always update, so the condition only
+            #   can skip it. The `row_record` column is a string, so it does
+            #   not compare with the existing row.
+            f"where TRUE {{condition}}"
+            + (f" RETURNING {', '.join(self.cols)}" if returning else "")
         )
 
     def statement_push(self) -> str:
+        """Generate update statement that bind values with column names and
+        filter primary keys with tuple of values.
+
+        :statement:
+
+            UPDATE DATABASE.SCHEMA.TABLE_NAME AS TN
+            SET {update_values_pairs}
+            WHERE TN.PRIMARY_KEY IN :PRIMARY_KEY AND ... {condition}
+        """
+        _filter: str = " AND ".join(
+            f"{self.tbl.shortname}.{pk} IN :{pk}" for pk in self.pk
+        )
         return reduce_stm(
             f"UPDATE {{database_name}}.{{ai_schema_name}}.{self.name} "
             f"AS {self.tbl.shortname} "
             f"set  {{update_values_pairs}} "
-            f"where {{filter}} {{condition}}"
+            f"where {_filter} {{condition}}"
         )
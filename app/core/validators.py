@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import importlib
 import re
+import time
 from collections.abc import Generator, Iterator
 from datetime import (
     date,
@@ -88,8 +89,8 @@ def sorted_set(values):
 def split_datatype(datatype_full: str) -> tuple[str, str]:
     """Split the datatype value from long string by null string."""
     _nullable: str = "null"
-    for null_str in ["not null", "null"]:
-        if re.search(null_str, datatype_full):
+    for null_str in ("not null", "null"):
+        if null_str in datatype_full:
             _nullable = null_str
             datatype_full = datatype_full.replace(null_str, "")
     return " ".join(datatype_full.strip().split()), _nullable
@@ -151,7 +152,7 @@ def filter_ps_type(
 
 
 def filter_not_null(datatype: str) -> bool:
-    return all(not re.search(word, datatype) for word in ("default", "serial"))
+    return "default" not in datatype and "serial" not in datatype
 
 
 AbstractSetOrDict = Union[
@@ -1519,17 +1520,34 @@ class FrameworkParameter(BaseUpdatableModel):
         default_factory=partial(get_run_date, "date_time"),
         description="Start datetime of this running framework parameter",
     )
+    _run_date_fmt: Optional[tuple[date, str]] = None
 
-    def duration(self, start: Optional[datetime] = None) -> int:
-        """Generate duration since this model start initialize data."""
-        _start: datetime = start or self.start_time
+    def run_date_fmt(self) -> str:
+        """Return the formatted string of run date that will format again only
+        when the run date was changed. This is a method, not a property,
+        because the properties of this model will include to its dict.
+        """
+        if self._run_date_fmt is None or self._run_date_fmt[0] != self.run_date:
+            self._run_date_fmt = (self.run_date, f"{self.run_date:%Y-%m-%d}")
+        return self._run_date_fmt[1]
+
+    def duration(self, start: Optional[float] = None) -> int:
+        """Generate duration since the checkpoint or since this model start
+        initialize data if the checkpoint does not pass.
+        """
+        if start is not None:
+            return round(time.monotonic() - start)
         return round(
-            (get_run_date(date_type="date_time") - _start).total_seconds()
+            (
+                get_run_date(date_type="date_time") - self.start_time
+            ).total_seconds()
         )
 
     @staticmethod
-    def checkpoint(date_type: Optional[str] = None):
-        return get_run_date(date_type=(date_type or "date_time"))
+    def checkpoint() -> float:
+        """Return the monotonic clock value that use to be the start point of
+        the duration method."""
+        return time.monotonic()
 
 
 class Choose(BaseUpdatableModel):
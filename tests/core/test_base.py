@@ -0,0 +1,116 @@
+import datetime
+import os
+import random
+import tempfile
+import unittest
+
+from app.core.base import _load_yaml, load_yaml, sort_by_priority
+
+
+def sort_by_priority_reference(values, priority_lists):
+    """The previous implementation of sort_by_priority that scans all
+    prefixes for each value."""
+    priority_dict: dict = {k: i for i, k in enumerate(priority_lists)}
+
+    def priority_getter(value):
+        return next(
+            (
+                order
+                for _, order in priority_dict.items()
+                if value.startswith(_)
+            ),
+            len(values),
+        )
+
+    if isinstance(values, list):
+        return sorted(values, key=priority_getter)
+    return {k: values[k] for k in sorted(values.keys(), key=priority_getter)}
+
+
+class SortByPriorityTestCase(unittest.TestCase):
+    """Test Case for sort_by_priority function from base file."""
+
+    def test_sort_by_priority(self):
+        self.assertEqual(
+            ["ai_b", "ai_a", "bc", "x", "a"],
+            sort_by_priority(
+                ["x", "ai_b", "bc", "a", "ai_a"], priority_lists=["ai_", "b"]
+            ),
+        )
+        self.assertEqual(
+            {"ba": 2, "ab": 1},
+            sort_by_priority({"ab": 1, "ba": 2}, priority_lists=["b"]),
+        )
+
+    def test_sort_by_priority_duplicate_prefixes(self):
+        values: list = ["ac", "a", "a", "ba", "aa"]
+        priority: list = ["", "b", "b", "", ""]
+        self.assertEqual(
+            sort_by_priority_reference(values, priority),
+            sort_by_priority(values, priority_lists=priority),
+        )
+
+    def test_sort_by_priority_fuzz(self):
+        _random = random.Random(0)
+        for _ in range(2000):
+            values: list = [
+                "".join(_random.choices("abc", k=_random.randint(0, 3)))
+                for _ in range(_random.randint(0, 8))
+            ]
+            priority: list = [
+                "".join(_random.choices("abc", k=_random.randint(0, 2)))
+                for _ in range(_random.randint(1, 6))
+            ]
+            self.assertEqual(
+                sort_by_priority_reference(values, priority),
+                sort_by_priority(values, priority_lists=priority),
+                msg=f"values={values}, priority={priority}",
+            )
+
+
+class LoadYamlTestCase(unittest.TestCase):
+    """Test Case for load_yaml function from base file."""
+
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path: str = os.path.join(self.tmp.name, "catalog_test.yaml")
+
+    def write(self, content: str, mtime_ns: int):
+        with open(self.path, mode="w", encoding="utf8") as f:
+            f.write(content)
+        os.utime(self.path, ns=(mtime_ns, mtime_ns))
+
+    def test_load_yaml(self):
+        self.write("tbl_a:\n  type: sql.table\n  run_date: 2024-01-02\n", 10)
+        result: dict = load_yaml(self.path)
+        self.assertDictEqual(
+            {
+                "tbl_a": {
+                    "type": "sql.table",
+                    "run_date": datetime.date(2024, 1, 2),
+                }
+            },
+            result,
+        )
+
+        # NOTE: The loaded data will not change by the caller.
+        result["tbl_a"]["type"] = "changed"
+        self.assertEqual("sql.table", load_yaml(self.path)["tbl_a"]["type"])
+
+    def test_load_yaml_cache(self):
+        self.write("tbl_a:\n  type: sql.table\n", 10)
+        load_yaml(self.path)
+        hits: int = _load_yaml.cache_info().hits
+        load_yaml(self.path)
+        self.assertEqual(hits + 1, _load_yaml.cache_info().hits)
+
+        # NOTE: The file will load again after it was modified.
+        self.write("tbl_b:\n  type: sql.table\n", 20)
+        self.assertDictEqual(
+            {"tbl_b": {"type": "sql.table"}}, load_yaml(self.path)
+        )
+
+    def test_load_yaml_empty(self):
+        self.write("", 10)
+        self.assertDictEqual({}, load_yaml(self.path))
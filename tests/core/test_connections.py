@@ -0,0 +1,128 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+
+import pandas as pd
+from sqlalchemy import create_engine
+
+from app.core.connections import io, postgresql
+from app.core.errors import WriteCSVError
+
+
+class QuerySelectDataFrameTestCase(unittest.TestCase):
+    """Test Case for query_select_df function from postgresql file."""
+
+    def setUp(self) -> None:
+        # NOTE: The column type of the column name will convert the boolean
+        #   value like the boolean column of PostgreSQL.
+        sqlite3.register_converter("boolean", lambda value: value == b"1")
+        self.addCleanup(sqlite3.converters.pop, "BOOLEAN")
+        self.engine = create_engine(
+            "sqlite://",
+            connect_args={"detect_types": sqlite3.PARSE_COLNAMES},
+        )
+        self.addCleanup(self.engine.dispose)
+        patcher = mock.patch.object(
+            postgresql, "get_engine", return_value=self.engine
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_query_select_df_keep_str(self):
+        try:
+            result: pd.DataFrame = postgresql.query_select_df(
+                'select 1 = 1 as "flag [boolean]", 1 = 0 as "other [boolean]", '
+                "null as empty, 'a' as name"
+            )
+        except TypeError as error:
+            # NOTE: pandas falls back to its DBAPI2 path and raises this error
+            #   when it does not support the installed sqlalchemy version.
+            if "unless using sqlalchemy" not in str(error):
+                raise
+            self.skipTest(f"pandas does not support sqlalchemy: {error}")
+        pd.testing.assert_frame_equal(
+            pd.DataFrame(
+                {
+                    "flag": [True],
+                    "other": [False],
+                    "empty": [None],
+                    "name": ["a"],
+                }
+            ).astype("str"),
+            result,
+        )
+
+
+class ZipTestCase(unittest.TestCase):
+    """Test Case for zip_ function from io file."""
+
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_zip_skip_symlink_dir(self):
+        from zipfile import ZipFile
+
+        folder: str = os.path.join(self.tmp.name, "logs")
+        os.makedirs(os.path.join(folder, "sub"))
+        for name in ("a.log", os.path.join("sub", "b.log"), "c.txt"):
+            with open(os.path.join(folder, name), mode="w") as f:
+                f.write(name)
+        os.symlink(folder, os.path.join(folder, "sub", "loop"))
+        filename: str = os.path.join(self.tmp.name, "logs.zip")
+        io.zip_(folder, filename, lambda name: name.endswith(".log"))
+        with ZipFile(filename) as zip_file:
+            self.assertEqual(["a.log", "b.log"], sorted(zip_file.namelist()))
+
+
+class PrepareCSVTestCase(unittest.TestCase):
+    """Test Case for prepare_csv function from io file."""
+
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.landing: str = os.path.join(self.tmp.name, "data", "landing")
+        self.success: str = os.path.join(self.tmp.name, "data", "success")
+        os.makedirs(self.landing)
+        os.makedirs(self.success)
+        patcher = mock.patch.object(io, "AI_APP_PATH", self.tmp.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp.cleanup)
+
+    def prepare(self, content: str, delimiter: str = "|") -> bytes:
+        with open(
+            os.path.join(self.landing, "file.csv"),
+            mode="w",
+            encoding="utf-8",
+            newline="",
+        ) as f:
+            f.write(content)
+        io.prepare_csv("file.csv", delimiter=delimiter, chunk_size=1)
+        with open(os.path.join(self.success, "file.csv"), mode="rb") as f:
+            return f.read()
+
+    def test_prepare_csv(self):
+        self.assertEqual(
+            b"\xef\xbb\xbfa|b_c|d\r\ne|f\r\n",
+            self.prepare('\ufeffa | b,c | "d"\n\n  e|f  \n'),
+        )
+        self.assertFalse(os.path.exists(os.path.join(self.landing, "file.csv")))
+
+    def test_prepare_csv_line_breaks(self):
+        self.assertEqual(
+            b"\xef\xbb\xbfa|b\r\nc|d\r\ne|f\r\n",
+            self.prepare("a;b\r\nc;d\re;f", delimiter=";"),
+        )
+
+    def test_prepare_csv_raise(self):
+        with self.assertRaisesRegex(
+            WriteCSVError, "need to escape, but no escapechar set"
+        ):
+            self.prepare("a,b|c\n", delimiter=",")
+
+        with self.assertRaisesRegex(
+            WriteCSVError, "single empty field record must be quoted"
+        ):
+            self.prepare("a|b\n   \n")
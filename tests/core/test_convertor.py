@@ -0,0 +1,314 @@
+import unittest
+
+from app.core.convertor import Statement, Value, reduce_stm
+from app.core.errors import (
+    ColumnsNotEqualError,
+    NullableColumnError,
+    OuterColumnError,
+    PrimaryKeyNotExists,
+    SQLInjection,
+)
+from app.core.validators import Column
+
+
+class ReduceStatementTestCase(unittest.TestCase):
+    """Test Case for reduce_stm function from convertor file."""
+
+    def test_reduce_stm(self):
+        self.assertEqual(
+            "select 1 ; select 2",
+            reduce_stm("  select\t1 ;\n select  2 "),
+        )
+
+    def test_reduce_stm_with_row_number(self):
+        self.assertEqual(
+            (
+                "select 1 ; with row_table as ( select 2 returning 1 ) "
+                "select count(*) as row_number from row_table"
+            ),
+            reduce_stm("  select\t1 ;\n select  2 ", add_row_number=True),
+        )
+        self.assertEqual(
+            "select count(*) as row_number from x",
+            reduce_stm("select count(*) as row_number from x", True),
+        )
+
+
+class StatementTestCase(unittest.TestCase):
+    """Test Case for Statement object from convertor file."""
+
+    def setUp(self) -> None:
+        self.input_str: str = (
+            "  insert into  {database_name}.{ai_schema_name}.tbl_a\n\t"
+            "( a, b ) select a, b from {database_name}.{ai_schema_name}.tbl_b "
+            "where run_date = '{run_date}'  "
+        )
+        self.input_dict: dict = {
+            "with_temp": (
+                "select * from {database_name}.{ai_schema_name}.tbl_c "
+                "join {database_name}.{ai_schema_name}.tbl_d on 1=1"
+            ),
+            "with_row_table": (
+                "update {database_name}.{ai_schema_name}.tbl_a set x = 1 "
+                "from temp where {param_x}"
+            ),
+            "drop_stm": "drop table  temp ;",
+        }
+
+    def test_statement_from_str(self):
+        result: Statement = Statement(self.input_str)
+        self.assertEqual(
+            (
+                "insert into {database_name}.{ai_schema_name}.tbl_a ( a, b ) "
+                "select a, b from {database_name}.{ai_schema_name}.tbl_b "
+                "where run_date = '{run_date}'; "
+            ),
+            result.generate(),
+        )
+        self.assertEqual("dml", result.type)
+        self.assertListEqual(["run_date"], result.stm_params)
+        self.assertSetEqual({("insert into", "tbl_a")}, result.target())
+        self.assertSetEqual({("from", "tbl_b")}, result.source())
+        self.assertDictEqual({1: ("tbl_b", "tbl_a")}, result.mapping())
+
+    def test_statement_from_dict(self):
+        result: Statement = Statement(self.input_dict)
+        self.assertEqual(
+            (
+                "with temp as ( select * from "
+                "{database_name}.{ai_schema_name}.tbl_c join "
+                "{database_name}.{ai_schema_name}.tbl_d on 1=1 ) "
+                "update {database_name}.{ai_schema_name}.tbl_a set x = 1 "
+                "from temp where {param_x}; drop table temp ; "
+            ),
+            result.generate(),
+        )
+        self.assertEqual("undefined", result.type)
+        self.assertListEqual(["param_x"], result.stm_params)
+        self.assertSetEqual({("update", "tbl_a")}, result.target())
+        self.assertSetEqual(
+            {("from", "tbl_c"), ("join", "tbl_d")}, result.source()
+        )
+        self.assertDictEqual({}, result.mapping())
+
+    def test_statement_delete(self):
+        result: Statement = Statement(
+            "delete from {database_name}.{ai_schema_name}.tbl_a "
+            "where id in ( select id "
+            "from {database_name}.{ai_schema_name}.tbl_b )"
+        )
+        self.assertSetEqual({("delete from", "tbl_a")}, result.target())
+        self.assertSetEqual(
+            {("from", "tbl_a"), ("from", "tbl_b")}, result.source()
+        )
+        self.assertDictEqual({1: ("tbl_b", "tbl_a")}, result.mapping())
+
+    def test_statement_from_dict_with_row_number(self):
+        result: Statement = Statement(self.input_dict, add_row_number=True)
+        self.assertEqual(
+            (
+                "with temp as ( select * from "
+                "{database_name}.{ai_schema_name}.tbl_c join "
+                "{database_name}.{ai_schema_name}.tbl_d on 1=1 ), "
+                "row_table as ( update {database_name}.{ai_schema_name}.tbl_a "
+                "set x = 1 from temp where {param_x} returning 1 ) "
+                "select count(*) from row_table; drop table temp ; "
+            ),
+            result.generate(),
+        )
+
+
+class ValueTestCase(unittest.TestCase):
+    """Test Case for Value object from convertor file."""
+
+    def setUp(self) -> None:
+        self.expected_cols: dict = {
+            "dc_code": Column(name="dc_code", datatype="varchar(10) not null"),
+            "dc_name": Column(name="dc_name", datatype="varchar(64)"),
+            "rdc_code": Column(
+                name="rdc_code", datatype="varchar(10) not null"
+            ),
+            "lead_time": Column(name="lead_time", datatype="integer"),
+            "update_date": Column(
+                name="update_date", datatype="timestamp not null"
+            ),
+        }
+        self.columns: list = [
+            "dc_code",
+            "dc_name",
+            "rdc_code",
+            "lead_time",
+            "update_date",
+        ]
+        self.update_date: str = "2024-01-02 03:04:05"
+
+    def generate(self, values, mode="common", action="insert") -> tuple:
+        return Value(
+            values=values,
+            update_date=self.update_date,
+            mode=mode,
+            action=action,
+            expected_cols=self.expected_cols,
+            expected_pk=["dc_code"],
+        ).generate()
+
+    def test_value_common_insert(self):
+        self.assertEqual(
+            (
+                self.columns,
+                (
+                    "('8910', 'DC Korat', '8910', '7', '2024-01-02 03:04:05'), "
+                    "('8920', null, '8930', null, '2024-01-02 03:04:05')"
+                ),
+            ),
+            self.generate(
+                [
+                    {
+                        "dc_code": "8910",
+                        "dc_name": "DC Korat",
+                        "rdc_code": "8910",
+                        "lead_time": 7,
+                    },
+                    {
+                        "dc_code": "8920",
+                        "dc_name": "",
+                        "rdc_code": "8930",
+                        "lead_time": 0,
+                    },
+                ]
+            ),
+        )
+
+    def test_value_common_update(self):
+        self.assertEqual(
+            (
+                self.columns,
+                (
+                    "('8910', 'DC Korat', '8910', '7', '2024-01-02 03:04:05'), "
+                    "('8920', '8930', '2024-01-02 03:04:05')"
+                ),
+            ),
+            self.generate(
+                [
+                    {
+                        "dc_code": "8910",
+                        "dc_name": "DC Korat",
+                        "rdc_code": "8910",
+                        "lead_time": 7,
+                    },
+                    {
+                        "dc_code": "8920",
+                        "dc_name": "",
+                        "rdc_code": "8930",
+                        "lead_time": 0,
+                    },
+                ],
+                action="update",
+            ),
+        )
+
+    def test_value_common_escape_quote(self):
+        self.assertEqual(
+            (
+                self.columns,
+                "('8910', 'DC ''Korat''', '8910', '7', '2024-01-02 03:04:05')",
+            ),
+            self.generate(
+                {
+                    "dc_code": "8910",
+                    "dc_name": "DC 'Korat'",
+                    "rdc_code": "8910",
+                    "lead_time": 7,
+                }
+            ),
+        )
+
+    def test_value_merge(self):
+        values: list = [
+            {
+                "dc_code": "8910",
+                "dc_name": "DC Korat",
+                "data_merge": [
+                    {"rdc_code": "8910", "lead_time": 7},
+                    {
+                        "rdc_code": "8920",
+                        "data_merge": [
+                            {"lead_time": 3, "dc_name": "DC Over"},
+                            {"lead_time": 4},
+                        ],
+                    },
+                ],
+            },
+            {
+                "dc_code": "8920",
+                "dc_name": "DC BKK",
+                "data_merge": {"rdc_code": "8930", "lead_time": 5},
+            },
+            {
+                "dc_code": "8930",
+                "dc_name": "DC X",
+                "rdc_code": "8940",
+                "lead_time": 1,
+            },
+        ]
+        self.assertEqual(
+            (
+                self.columns,
+                (
+                    "('8910', 'DC Korat', '8910', '7', '2024-01-02 03:04:05'), "
+                    "('8910', 'DC Over', '8920', '3', '2024-01-02 03:04:05'), "
+                    "('8910', 'DC Korat', '8920', '4', '2024-01-02 03:04:05'), "
+                    "('8920', 'DC BKK', '8930', '5', '2024-01-02 03:04:05'), "
+                    "('8930', 'DC X', '8940', '1', '2024-01-02 03:04:05')"
+                ),
+            ),
+            self.generate(values, mode="merge"),
+        )
+        self.assertEqual(
+            (
+                self.columns,
+                (
+                    "('8910', 'DC Korat', '8910', '7', '2024-01-02 03:04:05'), "
+                    "('8910', 'DC Over', '8920', '3', '2024-01-02 03:04:05'), "
+                    "('8910', 'DC Korat', '8920', '4', '2024-01-02 03:04:05')"
+                ),
+            ),
+            self.generate(values[0], mode="merge"),
+        )
+
+    def test_value_raise(self):
+        with self.assertRaises(NullableColumnError):
+            self.generate({"dc_code": "1", "dc_name": "a", "rdc_code": "2"})
+
+        with self.assertRaises(PrimaryKeyNotExists):
+            self.generate([{"dc_name": "a", "rdc_code": "2"}], action="update")
+
+        with self.assertRaises(ColumnsNotEqualError):
+            self.generate(
+                [
+                    {"dc_code": "1", "dc_name": "a"},
+                    {"dc_code": "1", "rdc_code": "a"},
+                ],
+                action="update",
+            )
+
+        with self.assertRaises(OuterColumnError):
+            self.generate(
+                {
+                    "dc_code": "1",
+                    "dc_name": "a",
+                    "data_merge": {"rdc_code": "2", "lead_time": 1, "other": 1},
+                },
+                mode="merge",
+            )
+
+    def test_value_sql_injection(self):
+        with self.assertRaises(SQLInjection):
+            self.generate(
+                {
+                    "dc_code": "1",
+                    "dc_name": "select * from x",
+                    "rdc_code": "2",
+                    "lead_time": 1,
+                }
+            )
@@ -2,7 +2,9 @@ import unittest
 
 from app.core.statements import (
     ColumnStatement,
+    ControlStatement,
     FunctionStatement,
+    reduce_condition,
 )
 from app.core.validators import Column
 
@@ -83,3 +85,51 @@ class FunctionStatementTestCase(unittest.TestCase):
             ),
             rs.statement(),
         )
+
+
+class ControlStatementTestCase(unittest.TestCase):
+    """Test Case for Control statement object from statements file."""
+
+    def test_statement_create_conflict_filter(self):
+        for name in (
+            "ctr_data_logging",
+            "ctr_task_process",
+            "ctr_data_pipeline",
+        ):
+            self.assertIn(
+                "where TRUE {condition}",
+                ControlStatement(name).statement_create(),
+            )
+
+    def test_statement_bind_values(self):
+        stm = ControlStatement("ctr_data_pipeline")
+        self.assertIn(
+            "VALUES ( :system_type, :table_name",
+            stm.statement_create(),
+        )
+        self.assertNotIn(":primary_id", stm.statement_create())
+        self.assertNotIn("RETURNING", stm.statement_create())
+        self.assertTrue(
+            stm.statement_create(returning=True).endswith(
+                f"RETURNING {', '.join(stm.cols)}"
+            )
+        )
+        self.assertIn("cdp.table_name IN :table_name", stm.statement_push())
+
+    def test_statement_order_priority(self):
+        self.assertEqual(
+            "ORDER BY CASE WHEN LEFT(table_name, 3) = 'ctr' THEN 0 "
+            "WHEN LEFT(table_name, 2) = 'ai' THEN 1 ELSE 2 END, table_name",
+            ControlStatement.statement_order_priority(["ctr", "ai"]),
+        )
+        self.assertIn(
+            "{condition} {order_by}",
+            ControlStatement("ctr_data_pipeline").statement_pull(),
+        )
+
+    def test_reduce_condition(self):
+        self.assertEqual("", reduce_condition(None))
+        self.assertEqual(
+            "AND (status = '0')",
+            reduce_condition('status = "0"'),
+        )
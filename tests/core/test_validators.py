@@ -7,6 +7,7 @@ from pydantic import ValidationError
 from app.core.models import Status, TaskComponent, TaskMode
 from app.core.validators import (
     Column,
+    FrameworkParameter,
     Profile,
     Table,
     TableFrontend,
@@ -861,3 +862,20 @@ class TaskValidatorTestCase(unittest.TestCase):
         }
         result: Task = Task.make(module="test")
         self.assertDictEqual(respec, result.dict(by_alias=False))
+
+
+class FrameworkParameterValidatorTestCase(unittest.TestCase):
+    """Test Case for FrameworkParameter model from validators file."""
+
+    def test_run_date_fmt(self):
+        result: FrameworkParameter = FrameworkParameter.parse_obj(
+            {
+                "run_id": 1,
+                "run_date": "2024-01-02",
+                "run_mode": TaskComponent.FRAMEWORK.value,
+            }
+        )
+        self.assertEqual("2024-01-02", result.run_date_fmt())
+        result.run_date = datetime.date(2024, 2, 3)
+        self.assertEqual("2024-02-03", result.run_date_fmt())
+        self.assertNotIn("run_date_fmt", result.dict())